@@ -30,6 +30,12 @@ class Config:
         self.IOU_THRESHOLD = 0.45           # IoU eşiği (NMS için)
         self.MIN_DETECTION_AREA = 500       # Minimum algılama alanı (piksel²)
         self.DETECTION_INTERVAL = 0.1       # Algılama aralığı (saniye)
+        self.YOLO_IMAGE_SIZE = 416          # Çıkarım girdi boyutu (letterbox, 32'nin katı)
+        self.MOTION_GATE_THRESHOLD = 2.0    # Sahne değişim eşiği (piksel başına ortalama fark, 0 = kapalı)
+        self.MOTION_GATE_MAX_SKIP = 2.0     # Durağan sahnede en uzun algılama arası (saniye)
+        self.YOLO_EXPORT_FORMAT = None      # Çalışma zamanı: None (PyTorch), 'onnx', 'openvino' veya 'engine'
+        self.YOLO_EXPORT_HALF = True        # Dışa aktarımda FP16 ağırlık kullan
+        self.YOLO_EXPORT_INT8 = False       # Dışa aktarımda INT8 nicemleme (kalibrasyon gerekir)
         
         # === MESAFE KONTROLÜ AYARLARI ===
         self.CLOSE_DISTANCE_THRESHOLD = 0.15    # Yakın mesafe eşiği (frame oranı)
@@ -40,10 +46,21 @@ class Config:
         self.TTS_RATE = 150                 # Konuşma hızı (kelime/dakika)
         self.TTS_VOLUME = 0.9               # Ses seviyesi (0.0-1.0)
         self.TTS_LANGUAGE = 'tr'            # Dil ayarı ('en' veya 'tr')
+        self.TTS_ENABLED = True             # False ise TTS motoru hiç başlatılmaz
         self.ALERT_INTERVAL = 10.0          # Uyarı aralığı (saniye)
         self.DIRECTION_ALERT_INTERVAL = 10.0  # Yön uyarısı aralığı (saniye)
         self.GENERAL_ANNOUNCE_INTERVAL = 10.0  # Genel duyuru aralığı (saniye)
         self.MAX_ALERT_QUEUE_SIZE = 10      # Maksimum uyarı kuyruğu boyutu
+        self.TTS_BARGE_CHUNK_WORDS = 5      # Acil uyarı kesme noktası aralığı (kelime)
+        self.TTS_BURST_SIZE = 4             # Tek seferde kuyruktan alınan en fazla mesaj
+        self.TTS_REALTIME_PRIORITY = 0      # Linux'ta TTS thread'i için SCHED_FIFO önceliği (0: kapalı, isteğe bağlı)
+        self.TTS_BACKEND = 'pyttsx3'        # Ses motoru: 'pyttsx3' veya 'piper'
+        self.PIPER_MODELS = {               # Dile göre Piper ses modeli (models/ altında)
+            'tr': "tr_TR-dfki-medium.onnx",
+            'en': "en_US-amy-low.onnx",
+        }
+        self.AUDIO_PLAYER = 'aplay'         # Piper wav dosyalarını çalan komut
+        self.TTS_MAX_THREADS = 2            # Sentezin kullanabileceği en fazla çekirdek (algılama aç kalmasın)
         
         # === NAVİGASYON AYARLARI ===
         self.MAX_OBJECTS_PER_ZONE = 3      # Bölge başına maksimum nesne sayısı
@@ -52,6 +69,7 @@ class Config:
         
         # === PERFORMANS AYARLARI ===
         self.MAX_FPS = 50                  # Maksimum FPS sınırı
+        self.FPS_WINDOW_FRAMES = 60        # FPS ölçümü kayan pencere uzunluğu (kare)
         self.PROCESSING_THREADS = 1        # İşleme thread sayısı
         self.MEMORY_LIMIT_MB = 512         # Bellek sınırı (MB)
         
@@ -59,6 +77,7 @@ class Config:
         self.DEBUG_MODE = False            # Debug modu
         self.SHOW_DISPLAY = True           # Görüntü gösterimi
         self.SAVE_FRAMES = False           # Frame kaydetme
+        self.USE_OPENCL = False            # Çizimleri OpenCL (cv2.UMat) ile yap
         self.LOG_DETECTIONS = True         # Algılama loglaması (CSV)
         
         # === DOSYA YOLLARI ===
@@ -97,10 +116,20 @@ class Config:
         self.YOLO_MODEL_PATH = os.getenv("YOLO_MODEL_PATH", self.YOLO_MODEL_PATH)
         self.CONFIDENCE_THRESHOLD = float(os.getenv("CONFIDENCE_THRESHOLD", 
                                                    self.CONFIDENCE_THRESHOLD))
+        self.YOLO_EXPORT_FORMAT = os.getenv("YOLO_EXPORT_FORMAT", self.YOLO_EXPORT_FORMAT) or None
+        self.YOLO_EXPORT_INT8 = os.getenv("YOLO_EXPORT_INT8", "false").lower() == "true"
         
         # Debug modu
         self.DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
         self.SHOW_DISPLAY = os.getenv("SHOW_DISPLAY", "true").lower() == "true"
+        self.USE_OPENCL = os.getenv("USE_OPENCL", "false").lower() == "true"
+        self.TTS_REALTIME_PRIORITY = int(os.getenv("TTS_REALTIME_PRIORITY", self.TTS_REALTIME_PRIORITY))
+        
+        # Ses motoru
+        self.TTS_ENABLED = os.getenv("TTS_ENABLED", "true").lower() == "true"
+        self.TTS_BACKEND = os.getenv("TTS_BACKEND", self.TTS_BACKEND)
+        self.PIPER_MODELS['tr'] = os.getenv("PIPER_MODEL_TR", self.PIPER_MODELS['tr'])
+        self.PIPER_MODELS['en'] = os.getenv("PIPER_MODEL_EN", self.PIPER_MODELS['en'])
     
     def get_camera_config(self) -> dict:
         """
@@ -125,10 +154,12 @@ class Config:
         """
         return {
             'model_path': self.YOLO_MODEL_PATH,
+            'export_format': self.YOLO_EXPORT_FORMAT,
             'confidence': self.CONFIDENCE_THRESHOLD,
             'iou': self.IOU_THRESHOLD,
             'min_area': self.MIN_DETECTION_AREA,
-            'interval': self.DETECTION_INTERVAL
+            'interval': self.DETECTION_INTERVAL,
+            'image_size': self.YOLO_IMAGE_SIZE
         }
     
     def get_tts_config(self) -> dict:
@@ -224,6 +255,7 @@ class Config:
             self.CAMERA_FPS = 20
             self.DETECTION_INTERVAL = 0.05
             self.MAX_FPS = 25
+            self.YOLO_IMAGE_SIZE = 320
             print("🚀 Yüksek performans modu aktif")
             
         elif mode == 'balanced':
@@ -231,6 +263,7 @@ class Config:
             self.CAMERA_FPS = 15
             self.DETECTION_INTERVAL = 0.1
             self.MAX_FPS = 20
+            self.YOLO_IMAGE_SIZE = 416
             print("⚖️ Dengeli performans modu aktif")
             
         elif mode == 'power_save':
@@ -238,6 +271,7 @@ class Config:
             self.CAMERA_FPS = 10
             self.DETECTION_INTERVAL = 0.2
             self.MAX_FPS = 15
+            self.YOLO_IMAGE_SIZE = 320
             print("🔋 Güç tasarrufu modu aktif")
         
         else:
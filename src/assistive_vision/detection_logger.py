@@ -11,8 +11,15 @@ import time
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
+from queue import Queue, Empty, Full
 import threading
 
+# Background writer tuning: rows are flushed when this many are pending
+# or when the oldest pending row is older than the flush interval
+LOG_QUEUE_SIZE = 4096
+LOG_FLUSH_ROWS = 256
+LOG_FLUSH_INTERVAL = 0.25
+
 
 class DetectionLogger:
     """
@@ -39,9 +46,15 @@ class DetectionLogger:
         self.alerts_file = self.log_dir / f"alerts_{self.session_id}.csv"
         self.session_file = self.log_dir / f"session_{self.session_id}.csv"
         
-        # Threading for file operations
+        # Background writer: callers enqueue (file, row) pairs, one thread
+        # appends them to the CSV files in batches
         self.write_lock = threading.Lock()
-        self.log_queue = []
+        self.log_queue = Queue(maxsize=LOG_QUEUE_SIZE)
+        self.dropped_rows = 0
+        self.closed = False
+        self._close_lock = threading.Lock()  # Keeps rows from landing behind the stop sentinel
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
         
         # Session statistics
         self.session_stats = {
@@ -192,11 +205,8 @@ class DetectionLogger:
                 zone
             ]
             
-            # Write to CSV
-            with self.write_lock:
-                with open(self.detections_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(row)
+            # Hand off to the writer thread
+            self._enqueue(self.detections_file, row)
             
             # Update statistics
             self.session_stats['total_detections'] += 1
@@ -248,11 +258,8 @@ class DetectionLogger:
                 'unknown'  # Zone can be calculated if needed
             ]
             
-            # Write to CSV
-            with self.write_lock:
-                with open(self.alerts_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(row)
+            # Hand off to the writer thread
+            self._enqueue(self.alerts_file, row)
             
             # Update statistics
             self.session_stats['total_alerts'] += 1
@@ -278,14 +285,102 @@ class DetectionLogger:
                 str(data)
             ]
             
-            with self.write_lock:
-                with open(self.session_file, 'a', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(row)
+            self._enqueue(self.session_file, row)
                     
         except Exception as e:
             print(f"❌ Session logging error: {e}")
     
+    def _enqueue(self, path: Path, row: List):
+        """
+        Queue a CSV row for the writer thread
+        
+        Never blocks the caller; rows are dropped (and counted) when the
+        writer falls behind. After close() the writer is gone, so rows are
+        written synchronously instead.
+        
+        Args:
+            path: Target CSV file
+            row: Row values
+        """
+        with self._close_lock:
+            if not self.closed:
+                try:
+                    self.log_queue.put_nowait((path, row))
+                except Full:
+                    self.dropped_rows += 1
+                return
+        
+        self._write_rows([(path, row)])
+    
+    def _writer_loop(self):
+        """Append queued rows to their CSV files in batches until a None sentinel"""
+        running = True
+        while running:
+            try:
+                item = self.log_queue.get(timeout=LOG_FLUSH_INTERVAL)
+            except Empty:
+                continue
+            
+            # Collect a batch: up to LOG_FLUSH_ROWS rows or one flush interval
+            batch = []
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= LOG_FLUSH_ROWS:
+                    break
+                try:
+                    item = self.log_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except Empty:
+                    break
+            else:
+                running = False
+            
+            self._write_rows(batch)
+    
+    def _write_rows(self, batch: List):
+        """
+        Write a batch of (file, row) pairs, opening each file once
+        
+        Args:
+            batch: Queued (path, row) pairs in arrival order
+        """
+        rows_by_file = {}
+        for path, row in batch:
+            rows_by_file.setdefault(path, []).append(row)
+        
+        with self.write_lock:
+            for path, rows in rows_by_file.items():
+                try:
+                    with open(path, 'a', newline='', encoding='utf-8') as f:
+                        csv.writer(f).writerows(rows)
+                except Exception as e:
+                    print(f"❌ CSV write error ({path.name}): {e}")
+    
+    def close(self, timeout: float = 2.0):
+        """
+        Stop the writer thread after it has written every queued row
+        
+        Rows logged afterwards are written synchronously by _enqueue.
+        
+        Args:
+            timeout: Maximum time to wait for the writer (seconds)
+        """
+        with self._close_lock:
+            if self.closed:
+                return
+            self.closed = True
+            
+            if not self.writer_thread.is_alive():
+                return
+            
+            try:
+                self.log_queue.put(None, timeout=timeout)
+            except Full:
+                print("⚠️ Log writer not responding, queued rows may be lost")
+                return
+        
+        self.writer_thread.join(timeout=timeout)
+    
     def get_session_stats(self) -> Dict:
         """
         Get current session statistics
@@ -346,6 +441,10 @@ Avg Detections/Frame: {stats['avg_detections_per_frame']:.2f}
             # Log session end
             stats = self.get_session_stats()
             self.log_session_event('session_end', stats)
+            self.close()
+            
+            if self.dropped_rows:
+                print(f"⚠️ {self.dropped_rows} log rows dropped (writer queue full)")
             
             # Generate and save summary
             summary = self.generate_summary_report()
@@ -7,7 +7,9 @@ YOLOv8 kullanarak gerçek zamanlı nesne algılama
 
 import cv2
 import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
+from pathlib import Path
 import time
 
 try:
@@ -17,6 +19,43 @@ except ImportError:
     print("⚠️ Ultralytics YOLOv8 bulunamadı. pip install ultralytics ile yükleyin.")
     YOLO_AVAILABLE = False
 
+# Dışa aktarılmış modelin .pt dosyasının yanındaki adı (Ultralytics kuralı)
+EXPORTED_MODEL_SUFFIXES = {
+    'onnx': '.onnx',
+    'openvino': '_openvino_model',
+    'engine': '.engine',  # TensorRT (yalnızca NVIDIA GPU)
+}
+
+# INT8 nicemlemeyi uygulayan formatlar (Ultralytics ONNX'te int8'i yok sayar)
+INT8_EXPORT_FORMATS = {'openvino', 'engine'}
+
+
+def cuda_available() -> bool:
+    """CUDA destekli GPU var mı kontrol et (TensorRT motoru için gerekli)"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+# Hareket kapısı için küçültülmüş kare boyutu (genişlik, yükseklik)
+MOTION_PROBE_SIZE = (64, 36)
+
+
+@lru_cache(maxsize=256)
+def label_size(text: str, scale: float, thickness: int) -> Tuple[int, int]:
+    """
+    Etiket metninin piksel ölçüsünü döndür (önbellekli)
+    
+    Etiketler kareler arasında tekrarlandığı için cv2.getTextSize her
+    metin/ölçek/kalınlık için bir kez çağrılır.
+    
+    Returns:
+        Tuple[int, int]: (genişlik, yükseklik)
+    """
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
+
 
 class ObjectDetector:
     """
@@ -33,8 +72,11 @@ class ObjectDetector:
         """
         self.config = config
         self.model = None
+        self.device = 'cpu'  # Raspberry Pi için CPU; TensorRT motoru GPU'da çalışır
         self.last_detection_time = 0
         self.detection_cache = []
+        self._last_probe = None  # Son algılanan karenin küçük kopyası
+        self.fixed_batch = False  # Aktarılmış model sabit (1) toplu boyutlu mu
         
         # Expanded target object classes (COCO dataset)
         self.target_classes = {
@@ -103,8 +145,11 @@ class ObjectDetector:
             print("🔄 YOLOv8 modeli yükleniyor...")
             
             # Hafif model kullan (Raspberry Pi için)
-            model_path = self.config.YOLO_MODEL_PATH
-            self.model = YOLO(model_path)
+            model_path = self.resolve_model_path(self.config.YOLO_MODEL_PATH)
+            self.model = YOLO(model_path, task='detect')
+            self.fixed_batch = not model_path.endswith('.pt')
+            if model_path.endswith('.engine'):
+                self.device = 0
             
             # Model ayarları
             self.model.overrides['verbose'] = False  # Ayrıntılı çıktıyı kapat
@@ -116,6 +161,75 @@ class ObjectDetector:
             print(f"❌ Model yükleme hatası: {e}")
             return False
     
+    def resolve_model_path(self, model_path: str) -> str:
+        """
+        Yapılandırılmış çalışma zamanı için model yolunu döndür
+        
+        YOLO_EXPORT_FORMAT ayarlıysa .pt modeli bir kez ONNX/OpenVINO
+        formatına (FP16 veya INT8) aktarılır ve sonraki açılışlarda
+        aktarılmış dosya kullanılır. Aktarılan modeller sabit giriş
+        boyutlu olduğundan dosya adı görüntü boyutu ve hassasiyeti içerir
+        (ör. yolov8n_416_fp16.onnx); performans modu veya INT8 ayarı
+        değişince yeniden aktarılır. Formatın uygulayamadığı hassasiyet
+        (ONNX'te INT8, CPU'da ONNX FP16) istenirse uyarı verilip FP32'ye
+        düşülür; dosya adı gerçek hassasiyeti gösterir. Aktarım başarısız
+        olursa PyTorch modeline geri dönülür.
+        
+        Args:
+            model_path: .pt model yolu
+            
+        Returns:
+            str: Yüklenecek model yolu
+        """
+        export_format = self.config.YOLO_EXPORT_FORMAT
+        if not export_format or not model_path.endswith('.pt'):
+            return model_path
+        
+        suffix = EXPORTED_MODEL_SUFFIXES.get(export_format)
+        if suffix is None:
+            print(f"⚠️ Desteklenmeyen model formatı: {export_format}, PyTorch kullanılacak")
+            return model_path
+        
+        if export_format == 'engine' and not cuda_available():
+            print("⚠️ TensorRT için CUDA bulunamadı, PyTorch kullanılacak")
+            return model_path
+        
+        imgsz = self.config.YOLO_IMAGE_SIZE
+        int8 = self.config.YOLO_EXPORT_INT8
+        half = self.config.YOLO_EXPORT_HALF
+        if int8 and export_format not in INT8_EXPORT_FORMATS:
+            print(f"⚠️ {export_format} formatı INT8 desteklemiyor, INT8 yok sayılacak")
+            int8 = False
+        if half and not int8 and export_format == 'onnx' and not cuda_available():
+            print("⚠️ ONNX FP16 aktarımı GPU gerektiriyor, FP32 kullanılacak")
+            half = False
+        
+        if int8:
+            precision = 'int8'
+        elif half:
+            precision = 'fp16'
+        else:
+            precision = 'fp32'
+        
+        source = Path(model_path)
+        exported = source.with_name(f"{source.stem}_{imgsz}_{precision}{suffix}")
+        if exported.exists():
+            return str(exported)
+        
+        try:
+            print(f"🔄 Model {export_format} formatına aktarılıyor ({imgsz}px, {precision})...")
+            output = YOLO(model_path).export(
+                format=export_format,
+                imgsz=imgsz,
+                half=half and not int8,
+                int8=int8,
+            )
+            # Ultralytics sabit adla yazar; ayara özel ada taşı
+            return str(Path(output).replace(exported))
+        except Exception as e:
+            print(f"⚠️ Model aktarım hatası: {e}, PyTorch kullanılacak")
+            return model_path
+    
     def detect_objects(self, frame: np.ndarray) -> List[Dict]:
         """
         Frame'de nesne algılama yap
@@ -136,47 +250,27 @@ class ObjectDetector:
             return self.detection_cache
         
         try:
+            # Sahne değişmediyse önceki sonuçları kullan (durağan kamera)
+            probe = cv2.resize(frame, MOTION_PROBE_SIZE, interpolation=cv2.INTER_AREA)
+            if self._scene_unchanged(probe, current_time):
+                return self.detection_cache
+            
             # YOLOv8 ile tahmin yap
             results = self.model(
                 frame,
                 conf=self.config.CONFIDENCE_THRESHOLD,
                 iou=self.config.IOU_THRESHOLD,
+                imgsz=self.config.YOLO_IMAGE_SIZE,
                 verbose=False,
-                device='cpu'  # Raspberry Pi için CPU kullan
+                device=self.device
             )
             
-            detections = []
-            
-            # Sonuçları işle
-            if results and len(results) > 0:
-                result = results[0]
-                
-                if result.boxes is not None:
-                    boxes = result.boxes.cpu().numpy()
-                    
-                    for box in boxes:
-                        # Bounding box koordinatları
-                        x1, y1, x2, y2 = box.xyxy[0].astype(int)
-                        confidence = float(box.conf[0])
-                        class_id = int(box.cls[0])
-                        
-                        # Sadece ilgilenilen sınıfları al
-                        if class_id in self.target_classes:
-                            detection = {
-                                'class_id': class_id,
-                                'class_name': self.target_classes[class_id],
-                                'confidence': confidence,
-                                'bbox': (x1, y1, x2, y2),
-                                'center': ((x1 + x2) // 2, (y1 + y2) // 2),
-                                'width': x2 - x1,
-                                'height': y2 - y1,
-                                'area': (x2 - x1) * (y2 - y1)
-                            }
-                            detections.append(detection)
+            detections = self._parse_result(results[0]) if results else []
             
             # Cache'i güncelle
             self.detection_cache = detections
             self.last_detection_time = current_time
+            self._last_probe = probe
             
             if self.config.DEBUG_MODE and detections:
                 print(f"🎯 {len(detections)} nesne algılandı")
@@ -187,6 +281,105 @@ class ObjectDetector:
             print(f"❌ Algılama hatası: {e}")
             return []
     
+    def _scene_unchanged(self, probe: np.ndarray, current_time: float) -> bool:
+        """
+        Son algılamadan beri sahne değişmedi mi kontrol et
+        
+        Küçültülmüş karelerin ortalama mutlak farkı eşiğin altındaysa ve
+        MOTION_GATE_MAX_SKIP süresi dolmadıysa model çağrısı atlanabilir.
+        
+        Args:
+            probe: MOTION_PROBE_SIZE boyutuna küçültülmüş kare
+            current_time: Şu anki zaman
+            
+        Returns:
+            bool: Algılama atlanmalı mı
+        """
+        threshold = self.config.MOTION_GATE_THRESHOLD
+        if threshold <= 0 or self._last_probe is None or probe.shape != self._last_probe.shape:
+            return False
+        
+        if (current_time - self.last_detection_time) >= self.config.MOTION_GATE_MAX_SKIP:
+            return False
+        
+        motion = cv2.norm(probe, self._last_probe, cv2.NORM_L1) / probe.size
+        return motion < threshold
+    
+    def detect_objects_batch(self, frames: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        Birden çok frame'i tek model çağrısında işle
+        
+        Kayıtlı video veya toplu değerlendirme içindir; canlı akışta her
+        zaman en yeni kare kullanıldığından detect_objects tercih edilmeli.
+        Algılama aralığı ve önbellek bu çağrıda uygulanmaz. Aktarılmış
+        (ONNX/OpenVINO/TensorRT) modeller toplu boyutu 1 olarak sabit
+        aktarıldığından bu modellerde her frame ayrı çağrıyla işlenir.
+        
+        Args:
+            frames: Aynı boyuttaki görüntü frame'leri
+            
+        Returns:
+            List[List[Dict]]: Her frame için algılanan nesneler
+        """
+        if not self.model or not frames:
+            return [[] for _ in frames]
+        
+        batches = [[frame] for frame in frames] if self.fixed_batch else [list(frames)]
+        
+        try:
+            results = []
+            for batch in batches:
+                results.extend(self.model(
+                    batch,
+                    conf=self.config.CONFIDENCE_THRESHOLD,
+                    iou=self.config.IOU_THRESHOLD,
+                    imgsz=self.config.YOLO_IMAGE_SIZE,
+                    verbose=False,
+                    device=self.device
+                ))
+            return [self._parse_result(result) for result in results]
+            
+        except Exception as e:
+            print(f"❌ Toplu algılama hatası: {e}")
+            return [[] for _ in frames]
+    
+    def _parse_result(self, result) -> List[Dict]:
+        """
+        Tek bir YOLO sonucunu algılama sözlüklerine çevir
+        
+        Args:
+            result: Ultralytics Results nesnesi
+            
+        Returns:
+            List[Dict]: Hedef sınıflara ait algılamalar
+        """
+        detections = []
+        
+        if result.boxes is not None:
+            boxes = result.boxes.cpu().numpy()
+            
+            for box in boxes:
+                # Bounding box koordinatları
+                x1, y1, x2, y2 = box.xyxy[0].astype(int)
+                confidence = float(box.conf[0])
+                class_id = int(box.cls[0])
+                
+                # Sadece ilgilenilen sınıfları al
+                if class_id in self.target_classes:
+                    detection = {
+                        'class_id': class_id,
+                        'class_name': self.target_classes[class_id],
+                        'confidence': confidence,
+                        'bbox': (x1, y1, x2, y2),
+                        'center': ((x1 + x2) // 2, (y1 + y2) // 2),
+                        'width': x2 - x1,
+                        'height': y2 - y1,
+                        'area': (x2 - x1) * (y2 - y1)
+                    }
+                    detections.append(detection)
+        
+        return detections
+    
     def draw_detections(self, frame: np.ndarray, detections: List[Dict]) -> np.ndarray:
         """
         Algılanan nesneleri frame üzerine çiz
@@ -213,9 +406,7 @@ class ObjectDetector:
             label = f"{class_name} {confidence:.2f}"
             
             # Label arka planı
-            (label_width, label_height), _ = cv2.getTextSize(
-                label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2
-            )
+            label_width, label_height = label_size(label, 0.6, 2)
             
             cv2.rectangle(
                 frame,
@@ -292,20 +292,24 @@ class ObjectTracker:
                 'unmatched_tracks': unmatched_tracks
             }
         
-        # Calculate similarity matrix
+        # Calculate similarity matrix (track attributes are read directly;
+        # building get_current_detection() dicts per pair is unnecessary)
+        track_ids = list(self.tracked_objects.keys())
+        tracks = [self.tracked_objects[track_id] for track_id in track_ids]
+        
         similarity_matrix = []
         for detection in detections:
+            class_id = detection['class_id']
+            bbox = detection['bbox']
+            center = detection['center']
             row = []
-            for track_id in self.tracked_objects:
-                tracked_obj = self.tracked_objects[track_id]
-                last_detection = tracked_obj.get_current_detection()
-                
-                if last_detection and detection['class_id'] == last_detection['class_id']:
+            for tracked_obj in tracks:
+                if tracked_obj.positions and class_id == tracked_obj.class_id:
                     # Calculate IoU similarity
-                    iou = self.calculate_iou(detection['bbox'], last_detection['bbox'])
+                    iou = self.calculate_iou(bbox, tracked_obj.bboxes[-1])
                     
                     # Calculate distance similarity
-                    distance = self.calculate_distance(detection['center'], last_detection['center'])
+                    distance = self.calculate_distance(center, tracked_obj.positions[-1])
                     distance_similarity = max(0, 1 - distance / self.max_distance_threshold)
                     
                     # Combined similarity
@@ -322,13 +326,13 @@ class ObjectTracker:
             best_similarity = 0.3  # Minimum threshold
             best_track_idx = -1
             
-            for j, track_id in enumerate(self.tracked_objects):
+            for j, track_id in enumerate(track_ids):
                 if track_id not in used_tracks and similarity_matrix[i][j] > best_similarity:
                     best_similarity = similarity_matrix[i][j]
                     best_track_idx = j
             
             if best_track_idx >= 0:
-                track_id = list(self.tracked_objects.keys())[best_track_idx]
+                track_id = track_ids[best_track_idx]
                 matches[i] = track_id
                 used_tracks.add(track_id)
                 if track_id in unmatched_tracks:
@@ -15,15 +15,18 @@ import cv2
 import numpy as np
 import time
 import threading
+from collections import deque
 from typing import Tuple, List, Dict, Optional
 
 # Modül importları
 from .object_detector import ObjectDetector
 from .distance_checker import DistanceChecker
-from .voice_alert import VoiceAlert
+from .voice_alert import VoiceAlert, start_queued_logging
 from .navigation_guide import NavigationGuide
 from .config import Config
 
+WINDOW_NAME = 'Engelli Destek Sistemi'
+
 
 class DisabilityAssistanceSystem:
     """
@@ -42,6 +45,15 @@ class DisabilityAssistanceSystem:
         self.cap = None
         self.initialize_camera()
         
+        # Yakalama thread'i yalnızca en yeni kareyi tutar
+        self._frame_ready = threading.Condition()
+        self._latest_frame = None
+        self._capture_thread = None
+        
+        # OpenCL yalnızca ayar açıksa ve cihaz destekliyorsa kullanılır
+        self.use_opencl = self.config.USE_OPENCL and cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        
         # Sistem bileşenlerini başlat
         self.detector = ObjectDetector(self.config)
         self.distance_checker = DistanceChecker(self.config)
@@ -50,9 +62,7 @@ class DisabilityAssistanceSystem:
         
         # Sistem durumu
         self.running = False
-        self.frame_count = 0
-        self.fps_counter = 0
-        self.last_fps_time = time.time()
+        self.frame_times = deque(maxlen=self.config.FPS_WINDOW_FRAMES)
         
         print("✅ Sistem başarıyla başlatıldı!")
     
@@ -86,20 +96,49 @@ class DisabilityAssistanceSystem:
             print(f"❌ Kamera başlatma hatası: {e}")
             return False
     
-    def read_frame(self) -> Optional[np.ndarray]:
+    def start_capture(self):
+        """Kare yakalama thread'ini başlat (sistem çalışırken kullanılır)"""
+        if self._capture_thread and self._capture_thread.is_alive():
+            return
+        
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+    
+    def _capture_loop(self):
+        """
+        Kameradan sürekli kare oku
+        
+        cap.read() sürücüde bloklandığı için ayrı thread'de çalışır; işleme
+        döngüsü yavaş kalırsa eski kare bekletilmez, yenisiyle değiştirilir.
+        """
+        while self.running and self.cap and self.cap.isOpened():
+            ret, frame = self.cap.read()
+            if not ret:
+                print("⚠️ Frame okunamadı!")
+                time.sleep(0.1)
+                continue
+            
+            with self._frame_ready:
+                self._latest_frame = frame
+                self._frame_ready.notify()
+    
+    def read_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
-        Kameradan frame oku
+        Yakalama thread'inden en yeni frame'i al
         
+        Args:
+            timeout: Yeni kare için en fazla bekleme süresi (saniye)
+            
         Returns:
             Optional[np.ndarray]: Okunan frame veya None
         """
         if not self.cap or not self.cap.isOpened():
             return None
         
-        ret, frame = self.cap.read()
-        if not ret:
-            print("⚠️ Frame okunamadı!")
-            return None
+        with self._frame_ready:
+            if self._latest_frame is None:
+                self._frame_ready.wait(timeout)
+            frame, self._latest_frame = self._latest_frame, None
         
         return frame
     
@@ -107,18 +146,19 @@ class DisabilityAssistanceSystem:
         """
         FPS hesapla (performans takibi için)
         
+        Son FPS_WINDOW_FRAMES karenin zaman damgalarından kayan pencere
+        ortalaması hesaplanır.
+        
         Returns:
             float: Mevcut FPS değeri
         """
-        self.frame_count += 1
-        current_time = time.time()
+        self.frame_times.append(time.perf_counter())
         
-        if current_time - self.last_fps_time >= 1.0:
-            self.fps_counter = self.frame_count / (current_time - self.last_fps_time)
-            self.frame_count = 0
-            self.last_fps_time = current_time
+        if len(self.frame_times) < 2:
+            return 0.0
         
-        return self.fps_counter
+        span = self.frame_times[-1] - self.frame_times[0]
+        return (len(self.frame_times) - 1) / max(span, 1e-6)
     
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, List[Dict]]:
         """
@@ -133,8 +173,10 @@ class DisabilityAssistanceSystem:
         # Nesne algılama yap
         detections = self.detector.detect_objects(frame)
         
-        # Debug için bounding box'ları çiz
-        annotated_frame = self.detector.draw_detections(frame.copy(), detections)
+        # Debug için bounding box'ları çiz (OpenCL açıksa GPU kopyasına;
+        # UMat yüklemesi zaten kopya olduğu için frame.copy() gerekmez)
+        canvas = cv2.UMat(frame) if self.use_opencl else frame.copy()
+        annotated_frame = self.detector.draw_detections(canvas, detections)
         
         # Mesafe kontrolü yap
         close_objects = self.distance_checker.check_distances(detections, frame.shape)
@@ -154,6 +196,10 @@ class DisabilityAssistanceSystem:
             close_objects: Yakın nesneler
             navigation_info: Navigasyon bilgileri
         """
+        # Ses kapalıyken hiçbir uyarı çağrısı yapma
+        if not self.voice_alert.is_enabled:
+            return
+        
         # Yakın nesne uyarıları
         for obj in close_objects:
             self.voice_alert.alert_close_object(obj)
@@ -168,14 +214,15 @@ class DisabilityAssistanceSystem:
         self.voice_alert.announce_objects(detections)
     
     def display_info(self, frame: np.ndarray, detections: List[Dict], 
-                    navigation_info: Dict) -> np.ndarray:
+                    navigation_info: Dict, frame_shape: Tuple = None) -> np.ndarray:
         """
         Frame üzerine bilgi metinlerini ekle
         
         Args:
-            frame: Görüntü frame'i
+            frame: Görüntü frame'i (np.ndarray veya cv2.UMat)
             detections: Algılanan nesneler
             navigation_info: Navigasyon bilgileri
+            frame_shape: Orijinal kare boyutu (UMat'ta shape olmadığı için)
             
         Returns:
             np.ndarray: Bilgi eklenmiş frame
@@ -197,7 +244,7 @@ class DisabilityAssistanceSystem:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
         
         # Bölge çizgileri (debug için)
-        height, width = frame.shape[:2]
+        height, width = (frame_shape or frame.shape)[:2]
         left_line = width // 3
         right_line = 2 * width // 3
         
@@ -210,6 +257,12 @@ class DisabilityAssistanceSystem:
         """Ana sistem döngüsü"""
         print("🎯 Sistem çalışmaya başladı. Çıkmak için 'q' tuşuna basın.")
         self.running = True
+        self.start_capture()
+        
+        # Pencereyi döngüden önce bir kez oluştur
+        if self.config.SHOW_DISPLAY:
+            cv2.namedWindow(WINDOW_NAME, cv2.WINDOW_NORMAL)
+            cv2.resizeWindow(WINDOW_NAME, self.config.CAMERA_WIDTH, self.config.CAMERA_HEIGHT)
         
         try:
             while self.running:
@@ -223,21 +276,18 @@ class DisabilityAssistanceSystem:
                 # Frame'i işle
                 annotated_frame, detections, close_objects, navigation_info = self.process_frame(frame)
                 
-                # Uyarıları işle (ayrı thread'de çalışabilir)
+                # Uyarıları işle: VoiceAlert yalnızca kendi kuyruğuna ekler,
+                # konuşma tek worker thread'inde yapılır (kare başına thread yok)
                 if len(detections) > 0 or len(close_objects) > 0:
-                    # Sesli uyarıları non-blocking şekilde çal
-                    threading.Thread(
-                        target=self.handle_alerts,
-                        args=(detections, close_objects, navigation_info),
-                        daemon=True
-                    ).start()
+                    self.handle_alerts(detections, close_objects, navigation_info)
                 
                 # Bilgileri ekle
-                display_frame = self.display_info(annotated_frame, detections, navigation_info)
+                display_frame = self.display_info(annotated_frame, detections,
+                                                  navigation_info, frame.shape)
                 
                 # Görüntüyü göster (debug için)
                 if self.config.SHOW_DISPLAY:
-                    cv2.imshow('Engelli Destek Sistemi', display_frame)
+                    cv2.imshow(WINDOW_NAME, display_frame)
                 
                 # Çıkış kontrolü
                 key = cv2.waitKey(1) & 0xFF
@@ -251,9 +301,6 @@ class DisabilityAssistanceSystem:
                     # Debug modunu aç/kapat
                     self.config.DEBUG_MODE = not self.config.DEBUG_MODE
                     print(f"Debug modu: {'AÇIK' if self.config.DEBUG_MODE else 'KAPALI'}")
-                
-                # CPU'yu rahatlatmak için kısa bekleme
-                time.sleep(0.01)
         
         except KeyboardInterrupt:
             print("\n🛑 Klavye ile durduruldu.")
@@ -270,6 +317,10 @@ class DisabilityAssistanceSystem:
         
         self.running = False
         
+        # Yakalama thread'inin son okumasını bitirmesini bekle
+        if self._capture_thread:
+            self._capture_thread.join(timeout=1.0)
+        
         # Kamerayı kapat
         if self.cap:
             self.cap.release()
@@ -287,6 +338,9 @@ class DisabilityAssistanceSystem:
 def main():
     """Ana fonksiyon"""
     try:
+        # Uyarı debug satırları kuyruktan ayrı thread'de yazılır
+        start_queued_logging()
+        
         # Sistem oluştur ve çalıştır
         system = DisabilityAssistanceSystem()
         system.run()
@@ -2,14 +2,32 @@
 # -*- coding: utf-8 -*-
 """
 Sesli Uyarı Modülü
-pyttsx3 kullanarak sesli uyarı ve yönlendirme sistemi
+pyttsx3 (veya Piper) kullanarak sesli uyarı ve yönlendirme sistemi
 """
 
+import atexit
+import hashlib
+import heapq
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
 import time
 import threading
-from typing import List, Dict, Optional
-from queue import Queue, Empty
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from typing import List, Dict, NamedTuple, Optional
+from queue import PriorityQueue, SimpleQueue, Full
 import logging
+import logging.handlers
+import sys
+
+import numpy as np
 
 try:
     import pyttsx3
@@ -18,6 +36,134 @@ except ImportError:
     print("⚠️ pyttsx3 bulunamadı. pip install pyttsx3 ile yükleyin.")
     TTS_AVAILABLE = False
 
+# Önbellekteki Piper kayıtlarını bellekten çalmak için (opsiyonel)
+try:
+    import simpleaudio
+    SIMPLEAUDIO_AVAILABLE = True
+except ImportError:
+    SIMPLEAUDIO_AVAILABLE = False
+
+# Piper ayrı bir program olarak çalıştırılır (pip paketi gerekmez)
+PIPER_AVAILABLE = shutil.which('piper') is not None
+
+# Acil uyarı öneki; Piper'da ayrı kaydedilip kuyruk sentezlenirken çalınır
+EMERGENCY_PREFIX = "EMERGENCY! "
+
+
+
+class PiperVoice(NamedTuple):
+    """Bir dil için hazırlanmış Piper sesi (tek atamayla değiştirilir)"""
+    model: str                  # .onnx ses modeli yolu
+    wavs: Dict[str, str]        # Sabit metin -> önbellekteki wav yolu
+    clips: Dict[str, object]    # Sabit metin -> belleğe yüklenmiş kayıt (simpleaudio)
+
+
+# Piper'da ayrı sentezlenen parçaların sınırı (virgül/nokta sonrası boşluk)
+CLAUSE_SPLIT = re.compile(r'(?<=[,.!?])\s+')
+
+# Uyarı başına debug ve TTS thread'i hata mesajları; format yalnızca kayıt
+# yazılırken uygulanır. Seviye ve yönlendirme uygulamaya bırakılır.
+logger = logging.getLogger(__name__)
+_log_listener = None
+
+
+def start_queued_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Kök logger'ı kuyruk üzerinden stdout'a bağla (uygulama giriş noktaları için)
+    
+    Kayıtlar ayrı bir thread'de yazılır; TTS thread'i stdout'ta beklemez.
+    Dinleyici çıkışta (atexit) durdurulur, kuyrukta kalan satırlar yazılır.
+    Birden fazla çağrıda ilk dinleyici döndürülür.
+    
+    Args:
+        level: Kök logger seviyesi
+        
+    Returns:
+        logging.handlers.QueueListener: Çalışan dinleyici
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return _log_listener
+    
+    log_queue = SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    return _log_listener
+
+# Okunmayı beklerken tekrar istenen mesajlar için ek
+REPEAT_TEMPLATES = {
+    'tr': "{text}, {count} kez",
+    'en': "{text}, {count} times",
+}
+
+# Uzaklık bantları (metre): <1, 1-2, 2-4, 4-8, >=8
+DISTANCE_BAND_EDGES = (1, 2, 4, 8)
+
+# Bant başına (şablon, aciliyet); {base} nesne mesajı, {distance} metre
+DISTANCE_TEMPLATES = {
+    'tr': (
+        ("Tehlike! {base}, çok yakın, bir metreden az", 3),
+        ("Dikkat! {base}, çok yakın, {distance} metre", 3),
+        ("Uyarı! {base}, yakın, {distance} metre", 2),
+        ("{base}, {distance} metre uzaklıkta", 1),
+        ("{base}, uzak, {distance} metre", 1),
+    ),
+    'en': (
+        ("Danger! {base}, very close, less than one meter", 3),
+        ("Warning! {base}, very close, {distance} meters", 3),
+        ("Caution! {base}, close, {distance} meters", 2),
+        ("{base}, {distance} meters away", 1),
+        ("{base}, far, {distance} meters away", 1),
+    ),
+}
+
+# Uzaklık bilinmediğinde distance_level'a göre (şablon, aciliyet)
+LEVEL_TEMPLATES = {
+    'very_close': ("Warning! {base}, very close", 3),
+    'close': ("Caution! {base}", 2),
+}
+
+# Uzaklığa göre oluşturulan mesaj önbelleğinin üst sınırı
+COMPOSED_CACHE_LIMIT = 1024
+
+
+def _reset_thread_priority():
+    """
+    Thread'i normal zamanlamaya döndür
+    
+    SCHED_FIFO çalışan thread'inden açılan sentez thread'leri bu önceliği
+    devralır; CPU yoğun sentezin algılama döngüsünü bekletmemesi için
+    havuz thread'leri başlarken sıfırlanır.
+    """
+    if hasattr(os, 'sched_setscheduler'):
+        try:
+            os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+        except OSError:
+            pass
+
+
+# Alt süreçler (piper, aplay) SCHED_FIFO çalışan thread'in önceliğini
+# devralmasın; fork sonrası normal zamanlamaya döndürülür (yalnızca POSIX)
+_CHILD_PREEXEC = _reset_thread_priority if os.name == 'posix' else None
+
+
+def _discard_live_wav(future):
+    """Çalınmadan kalan anlık sentez dosyasını sentez bitince sil"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        os.remove(future.result())
+    except OSError:
+        pass
+
 
 class VoiceAlert:
     """
@@ -34,17 +180,27 @@ class VoiceAlert:
         """
         self.config = config
         self.engine = None
-        self.is_enabled = True
+        self.is_enabled = config.TTS_ENABLED
         self.is_speaking = False
         
-        # Uyarı kuyruğu ve threading
-        self.alert_queue = Queue()
+        # Uyarı kuyruğu ve threading: öğeler (-öncelik, sıra, mesaj);
+        # yüksek öncelik önce, eşit öncelikte geliş sırası korunur
+        self.alert_queue = PriorityQueue(maxsize=self.config.MAX_ALERT_QUEUE_SIZE)
+        self._seq = count()
+        
+        # Kuyrukta bekleyen metinler ve kaç kez istendikleri (aynı metin
+        # ikinci kez eklenmez, sayısı okunur); alert_queue.mutex altında
+        self._pending: Dict[str, int] = {}
         self.worker_thread = None
         self.stop_thread = False
         
-        # Uyarı throttling için
-        self.last_alerts = {}  # nesne_türü: son_uyarı_zamanı
-        self.last_direction_alert = 0
+        # Uyarı throttling için (anahtar: son_uyarı_zamanı, time.monotonic)
+        self._throttle: Dict[object, float] = {}
+        self._now = time.monotonic  # Sıcak yolda modül/öznitelik aramasını atla
+        
+        # Piper arka ucu: önceden üretilmiş wav dosyaları (metin -> yol)
+        self._piper_voice: Optional[PiperVoice] = None
+        self._synth_pool = None
         
         # Dual language voice messages (English & Turkish)
         self.language = config.TTS_LANGUAGE if hasattr(config, 'TTS_LANGUAGE') else 'en'
@@ -176,6 +332,25 @@ class VoiceAlert:
             }
         }
         
+        # Uzaklık bilgisi olmayan uyarılar için hazır mesajlar:
+        # (dil, sınıf, distance_level) -> (metin, aciliyet)
+        self._composed = {}
+        for language, lang_messages in self.messages.items():
+            for class_name in lang_messages:
+                for level in ('very_close', 'close', 'medium'):
+                    self._composed[(language, class_name, level)] = self._compose_message(
+                        class_name, level, language=language)
+        
+        # Uzaklıklı mesajlar ilk kullanımda oluşturulup burada tutulur
+        self._distance_messages = {}
+        
+        # Nesne uyarısı throttling tablosu: (sınıf, distance_level) -> indeks,
+        # son uyarı zamanları (time.monotonic) tek bir float dizisinde
+        levels = ('very_close', 'close', 'medium')
+        self._alert_idx = {(class_name, level): i for i, (class_name, level) in
+                           enumerate((c, l) for c in self.messages['en'] for l in levels)}
+        self._last_alert_ts = np.full(len(self._alert_idx), -np.inf)
+        
         self.initialize_tts()
         self.start_worker_thread()
     
@@ -183,6 +358,26 @@ class VoiceAlert:
         """
         TTS motorunu başlat
         
+        Returns:
+            bool: Başlatma durumu
+        """
+        if not self.config.TTS_ENABLED:
+            print("🔇 TTS ayarlardan kapalı, motor başlatılmadı")
+            return False
+        
+        if self.config.TTS_BACKEND == 'piper':
+            # Piper sesleri hazırlanırken (açılış, dil değişimi) ve Piper
+            # kullanılamazsa uyarılar pyttsx3 ile okunur
+            self._piper_voice = None
+            engine_ready = self._initialize_pyttsx3()
+            return self._initialize_piper() or engine_ready
+        
+        return self._initialize_pyttsx3()
+    
+    def _initialize_pyttsx3(self) -> bool:
+        """
+        pyttsx3 motorunu başlat ve sesini seç
+        
         Returns:
             bool: Başlatma durumu
         """
@@ -194,38 +389,19 @@ class VoiceAlert:
             print("🔊 TTS motoru başlatılıyor...")
             self.engine = pyttsx3.init()
             
-            # TTS ayarları (Raspberry Pi için optimize)
-            voices = self.engine.getProperty('voices')
-            
-            # Select voice based on language setting
-            selected_voice = None
-            
-            if self.language == 'tr':
-                # Look for Turkish voice first
-                for voice in voices:
-                    if 'tr' in voice.id.lower() or 'turkish' in voice.name.lower() or 'türk' in voice.name.lower():
-                        selected_voice = voice
-                        print(f"🎤 Using Turkish voice: {voice.name}")
-                        break
-                
-                if not selected_voice:
-                    print("⚠️ Turkish voice not found, using default voice for Turkish text")
-                    selected_voice = voices[0] if voices else None
-            
-            else:
-                # Look for English voice
-                for voice in voices:
-                    if 'en' in voice.id.lower() or 'english' in voice.name.lower():
-                        selected_voice = voice
-                        print(f"🎤 Using English voice: {voice.name}")
-                        break
-                
-                if not selected_voice:
-                    print("⚠️ English voice not found, using default voice")
-                    selected_voice = voices[0] if voices else None
+            # Ses seçimi: önceki açılışta seçilen ses varsa listeyi tarama
+            voice_id = self._cached_voice_id()
+            if voice_id is not None:
+                try:
+                    self.engine.setProperty('voice', voice_id)
+                except Exception:
+                    voice_id = None
             
-            if selected_voice:
-                self.engine.setProperty('voice', selected_voice.id)
+            if voice_id is None:
+                voice_id = self._select_voice()
+                if voice_id is not None:
+                    self.engine.setProperty('voice', voice_id)
+                    self._store_voice_id(voice_id)
             
             # Konuşma hızı ve ses seviyesi
             self.engine.setProperty('rate', self.config.TTS_RATE)
@@ -238,68 +414,582 @@ class VoiceAlert:
             print(f"❌ TTS başlatma hatası: {e}")
             return False
     
+    def _select_voice(self) -> Optional[str]:
+        """
+        Dil ayarına uygun sesi motorun ses listesinden seç
+        
+        Returns:
+            Optional[str]: Seçilen sesin kimliği (ses yoksa None)
+        """
+        # TTS ayarları (Raspberry Pi için optimize)
+        voices = self.engine.getProperty('voices')
+        
+        # Select voice based on language setting
+        selected_voice = None
+        
+        if self.language == 'tr':
+            # Look for Turkish voice first
+            for voice in voices:
+                if 'tr' in voice.id.lower() or 'turkish' in voice.name.lower() or 'türk' in voice.name.lower():
+                    selected_voice = voice
+                    print(f"🎤 Using Turkish voice: {voice.name}")
+                    break
+            
+            if not selected_voice:
+                print("⚠️ Turkish voice not found, using default voice for Turkish text")
+                selected_voice = voices[0] if voices else None
+        
+        else:
+            # Look for English voice
+            for voice in voices:
+                if 'en' in voice.id.lower() or 'english' in voice.name.lower():
+                    selected_voice = voice
+                    print(f"🎤 Using English voice: {voice.name}")
+                    break
+            
+            if not selected_voice:
+                print("⚠️ English voice not found, using default voice")
+                selected_voice = voices[0] if voices else None
+        
+        return selected_voice.id if selected_voice else None
+    
+    def _voice_cache_key(self) -> str:
+        """Ses önbelleği anahtarı (platform ve dil)"""
+        return f"{platform.system()}-{platform.machine()}-{self.language}"
+    
+    def _cached_voice_id(self) -> Optional[str]:
+        """
+        Önceki açılışta seçilen ses kimliğini oku
+        
+        Ses listesini taramak (SAPI/espeak) Pi'de açılışı yüzlerce ms
+        geciktirebildiği için seçim DATA_DIR/tts_voice.json'da saklanır.
+        
+        Returns:
+            Optional[str]: Kayıtlı ses kimliği (yoksa None)
+        """
+        try:
+            with open(self.config.DATA_DIR / 'tts_voice.json', encoding='utf-8') as f:
+                return json.load(f).get(self._voice_cache_key())
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    def _store_voice_id(self, voice_id: str):
+        """Seçilen ses kimliğini sonraki açılışlar için kaydet"""
+        path = self.config.DATA_DIR / 'tts_voice.json'
+        try:
+            with open(path, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[self._voice_cache_key()] = voice_id
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"⚠️ Ses seçimi kaydedilemedi: {e}")
+    
+    def _initialize_piper(self) -> bool:
+        """
+        Geçerli dilin Piper sesini hazırla ve sabit mesajları wav'a çevir
+        
+        Sabit mesajlar bir kez sentezlenip diske yazılır; okunurken yalnızca
+        çalınır. Yeni ses tamamen hazırlandıktan sonra tek atamayla devreye
+        alınır, çalışan thread yarım kalmış önbellek görmez. Piper, model
+        veya çalıcı bulunamazsa pyttsx3 kullanılır.
+        
+        Returns:
+            bool: Piper kullanılabilir mi
+        """
+        language = self.language
+        model = self.config.MODELS_DIR / self.config.PIPER_MODELS.get(language, '')
+        if not PIPER_AVAILABLE or not model.is_file() or not shutil.which(self.config.AUDIO_PLAYER):
+            print("⚠️ Piper, model veya ses çalıcı bulunamadı, pyttsx3 kullanılacak")
+            return False
+        
+        self._piper_env = {**os.environ, 'OMP_NUM_THREADS': '1', 'MKL_NUM_THREADS': '1'}
+        self._piper_cache_dir = self.config.DATA_DIR / 'tts_cache'
+        self._piper_cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Önceki çalıştırmadan kalmış anlık sentez dosyalarını temizle
+        if self._synth_pool is None:
+            for stale in self._piper_cache_dir.glob('live_*.wav'):
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+        
+        print(f"🔊 Piper mesajları hazırlanıyor ({model.name})...")
+        wavs = {}
+        try:
+            lang_messages = self.messages.get(language, self.messages['en'])
+            for text in (*lang_messages.values(), EMERGENCY_PREFIX):
+                wavs[text] = self._piper_render(text, self._cached_wav_path(text, str(model)), str(model))
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ Piper başlatma hatası: {e}")
+            return False
+        
+        # Sabit mesajlar bellekte PCM olarak tutulur; okurken süreç açılmaz
+        clips = {}
+        if SIMPLEAUDIO_AVAILABLE:
+            try:
+                clips = {text: simpleaudio.WaveObject.from_wave_file(path)
+                         for text, path in wavs.items()}
+            except Exception as e:
+                print(f"⚠️ Kayıtlar belleğe yüklenemedi, {self.config.AUDIO_PLAYER} kullanılacak: {e}")
+                clips = {}
+        
+        if self._synth_pool is None:
+            # Her Piper süreci tek thread'le çalışır; eşzamanlı süreç sayısı
+            # TTS_MAX_THREADS ile sınırlı, böylece sentez algılama döngüsünün
+            # çekirdeklerini doldurmaz
+            self._synth_pool = ThreadPoolExecutor(max_workers=max(1, self.config.TTS_MAX_THREADS),
+                                                  thread_name_prefix='PiperSynth',
+                                                  initializer=_reset_thread_priority)
+        
+        # Hazırlık sırasında dil yeniden değiştiyse eski dilin sesini kurma
+        if language != self.language:
+            return False
+        
+        self._piper_voice = PiperVoice(str(model), wavs, clips)
+        print(f"✅ Piper hazır ({len(wavs)} mesaj önbellekte)")
+        return True
+    
+    def _cached_wav_path(self, text: str, model: str) -> str:
+        """Metin ve model için önbellek dosya yolu"""
+        digest = hashlib.sha1(f"{model}\0{text}".encode('utf-8')).hexdigest()[:16]
+        return str(self._piper_cache_dir / f"{digest}.wav")
+    
+    def _piper_render(self, text: str, path: str, model: str) -> str:
+        """
+        Metni Piper ile önbellek dosyasına sentezle (dosya varsa atla)
+        
+        Sentez geçici dosyaya yapılıp yerine taşınır; yarıda kalan sentez
+        önbellekte bozuk dosya bırakmaz.
+        
+        Returns:
+            str: wav dosyasının yolu
+        """
+        if not os.path.exists(path):
+            os.replace(self._piper_live(text, model), path)
+        return path
+    
+    def _piper_live(self, text: str, model: str) -> str:
+        """
+        Metni Piper ile yeni, benzersiz adlı geçici wav dosyasına sentezle
+        
+        Dosya her çağrıda yeniden oluşturulur (var olan dosya asla yeniden
+        kullanılmaz); çalındıktan sonra çağıran siler.
+        
+        Returns:
+            str: wav dosyasının yolu
+        """
+        fd, path = tempfile.mkstemp(prefix='live_', suffix='.wav', dir=self._piper_cache_dir)
+        os.close(fd)
+        try:
+            subprocess.run(['piper', '--model', model, '--output_file', path],
+                           input=text.encode('utf-8'), check=True, env=self._piper_env,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           preexec_fn=_CHILD_PREEXEC)
+        except BaseException:
+            os.remove(path)
+            raise
+        return path
+    
+    def _piper_fragments(self, text: str, voice: PiperVoice) -> List[str]:
+        """
+        Önbellekte olmayan metni cümle/yan cümle parçalarına böl
+        
+        Acil uyarıda hazır önek ayrı parça olarak başa alınır.
+        """
+        if text in voice.wavs:
+            return [text]
+        
+        fragments = []
+        if text.startswith(EMERGENCY_PREFIX):
+            fragments.append(EMERGENCY_PREFIX)
+            text = text[len(EMERGENCY_PREFIX):]
+        fragments.extend(part for part in CLAUSE_SPLIT.split(text) if part)
+        return fragments
+    
+    def _play_wav(self, path: str):
+        """wav dosyasını AUDIO_PLAYER ile çal (bitene kadar bekler)"""
+        subprocess.run([self.config.AUDIO_PLAYER, path],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       preexec_fn=_CHILD_PREEXEC)
+    
+    def _speak_piper(self, texts: List[str], voice: PiperVoice):
+        """
+        Metinleri Piper ile oku
+        
+        Önbellekteki mesajlar doğrudan (simpleaudio varsa bellekten) çalınır.
+        Diğerleri parçalara bölünüp
+        iki işçili havuzda sentezlenir; parçalar sırayla çalınırken sonraki
+        parçaların sentezi devam eder, böylece ilk ses tüm mesajın
+        sentezini beklemez. Kesme işareti parça aralarında kontrol edilir.
+        
+        Args:
+            texts: Öncelik sırasına göre okunacak metinler
+            voice: Okuma boyunca kullanılacak Piper sesi
+        """
+        # Sırayla çalınacak (acil mi, parça, wav yolu veya Future) listesi
+        playlist = []
+        for text in texts:
+            if self.config.DEBUG_MODE:
+                logger.info("🔊 Sesli uyarı: %s", text)
+            
+            urgent = text.startswith(EMERGENCY_PREFIX)
+            for fragment in self._piper_fragments(text, voice):
+                path = voice.wavs.get(fragment)
+                if path is None:
+                    path = self._synth_pool.submit(self._piper_live, fragment, voice.model)
+                playlist.append((urgent, fragment, path))
+        
+        self.is_speaking = True
+        try:
+            for index, (urgent, fragment, path) in enumerate(playlist):
+                if not urgent and self._emergency_waiting():
+                    return
+                
+                if isinstance(path, str):
+                    clip = voice.clips.get(fragment)
+                    if clip is not None:
+                        clip.play().wait_done()
+                    else:
+                        self._play_wav(path)
+                    continue
+                
+                # Anlık sentez: dosya çalınsa da çalınamasa da silinir
+                playlist[index] = (urgent, fragment, None)
+                live_path = path.result()
+                try:
+                    self._play_wav(live_path)
+                finally:
+                    os.remove(live_path)
+            
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("❌ TTS hatası: %s", e)
+        
+        finally:
+            # Kesilen okumada çalınmayacak parçaların sentezini iptal et;
+            # başlamış olanların dosyası sentez bitince silinir
+            for _, _, path in playlist:
+                if path is not None and not isinstance(path, str) and not path.cancel():
+                    path.add_done_callback(_discard_live_wav)
+            self.is_speaking = False
+    
     def start_worker_thread(self):
         """Sesli uyarı işleme thread'ini başlat"""
         if self.worker_thread and self.worker_thread.is_alive():
             return
         
         self.stop_thread = False
-        self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker_thread = threading.Thread(target=self._worker_loop, name='VoiceAlertWorker',
+                                              daemon=True)
         self.worker_thread.start()
         print("🔧 Sesli uyarı thread'i başlatıldı")
     
+    def _raise_worker_priority(self):
+        """
+        Çalışan thread'i Linux'ta SCHED_FIFO gerçek zamanlı önceliğe al
+        
+        4 çekirdekli Pi'de algılama döngüsüyle yarışan TTS thread'i, kuyruğa
+        eklenen uyarıyı beklemeden seslendirebilsin diye kullanılır. pyttsx3
+        sentezi bu thread'de yapıldığından algılamayı aç bırakabilir; bu
+        yüzden varsayılan kapalıdır (TTS_REALTIME_PRIORITY=0). Yetki yoksa
+        (ulimit -r / CAP_SYS_NICE) normal zamanlamayla devam edilir.
+        """
+        priority = self.config.TTS_REALTIME_PRIORITY
+        if not priority or not hasattr(os, 'sched_setscheduler'):
+            return
+        
+        try:
+            # pid 0: çağıran thread (yalnızca bu thread etkilenir)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (PermissionError, OSError) as e:
+            print(f"⚠️ SCHED_FIFO ayarlanamadı, normal zamanlama kullanılıyor: {e}")
+    
     def _worker_loop(self):
-        """Sesli uyarı işleme döngüsü"""
-        while not self.stop_thread:
+        """Sesli uyarı işleme döngüsü (None mesajı gelince durur)"""
+        self._raise_worker_priority()
+        
+        while True:
+            # Mesaj gelene kadar bekle (boşta periyodik uyanma yok), sonra
+            # bekleyen diğer mesajları da al (öncelik sırasıyla gelirler);
+            # hepsi aynı tur(lar)da okunur. Kuyruk kilidi tur başına bir
+            # kez alınır, bekleyen metin kümesi de aynı kilit altındadır.
+            queue = self.alert_queue
+            limit = max(1, self.config.TTS_BURST_SIZE)
+            burst = []
+            with queue.not_empty:
+                while not queue.queue:
+                    queue.not_empty.wait()
+                while queue.queue and len(burst) < limit and (not burst or burst[-1] is not None):
+                    burst.append(heapq.heappop(queue.queue)[2])
+                for i, item in enumerate(burst):
+                    if item:
+                        repeats = self._pending.pop(item['text'], 1)
+                        if repeats > 1:
+                            burst[i] = self._with_repeat_count(item, repeats)
+                queue.not_full.notify(len(burst))
+            
+            stopping = burst[-1] is None
             try:
-                # Kuyruktan mesaj al (1 saniye timeout)
-                alert_data = self.alert_queue.get(timeout=1.0)
-                
-                if alert_data and self.is_enabled and self.engine:
-                    self._speak_text(alert_data['text'], alert_data.get('priority', 1))
-                
-                self.alert_queue.task_done()
-                
-            except Empty:
-                continue
+                texts = [] if stopping else self._select_burst(burst)
+                if texts and self.is_enabled:
+                    voice = self._piper_voice
+                    if voice is not None:
+                        self._speak_piper(texts, voice)
+                    elif self.engine:
+                        self._speak_burst(texts)
             except Exception as e:
-                print(f"❌ Sesli uyarı thread hatası: {e}")
+                logger.error("❌ Sesli uyarı thread hatası: %s", e)
+            finally:
+                for _ in burst:
+                    self.alert_queue.task_done()
+            
+            if stopping:
+                break
     
-    def _speak_text(self, text: str, priority: int = 1):
+    def _select_burst(self, burst: List[Dict]) -> List[str]:
         """
-        Metni sesli olarak oku
+        Kuyruktan alınan mesajlardan okunacakları seç
+        
+        Turda veya kuyrukta acil uyarı varsa acil olmayan mesajlar atlanır.
         
         Args:
-            text: Okunacak metin
-            priority: Öncelik seviyesi (1=düşük, 3=yüksek)
+            burst: Kuyruktan öncelik sırasıyla alınan mesajlar
+            
+        Returns:
+            List[str]: Okunacak metinler
         """
-        if not self.engine or not self.is_enabled:
-            return
+        items = [item for item in burst if item]
         
+        emergencies = [item for item in items if item.get('type') == 'emergency']
+        if emergencies or self._emergency_waiting():
+            items = emergencies
+        
+        return [item['text'] for item in items]
+    
+    def _speak_burst(self, texts: List[str]):
+        """
+        Metinleri sesli olarak oku
+        
+        Metinler en fazla TTS_BARGE_CHUNK_WORDS kelimelik parçalara bölünür
+        ve kısa parçalar tek runAndWait() turunda birleştirilir; sürücü
+        her mesaj için ayrı ayrı başlatılmaz. engine.stop() sürücüyü
+        kilitleyebildiği için acil uyarı tur aralarında araya girer.
+        
+        Args:
+            texts: Öncelik sırasına göre okunacak metinler
+        """
+        chunk_size = max(1, self.config.TTS_BARGE_CHUNK_WORDS)
+        
+        self.is_speaking = True
         try:
-            # Eğer konuşuyorsa ve düşük öncelikli mesajsa bekle
-            if self.is_speaking and priority < 3:
-                return
-            
-            # Yüksek öncelikli mesaj varsa mevcut konuşmayı durdur
-            if priority >= 3 and self.is_speaking:
-                self.engine.stop()
-            
-            self.is_speaking = True
-            
-            if self.config.DEBUG_MODE:
-                print(f"🔊 Sesli uyarı: {text}")
+            group, group_words = [], 0
+            for text in texts:
+                if self.config.DEBUG_MODE:
+                    logger.info("🔊 Sesli uyarı: %s", text)
+                
+                words = text.split()
+                for start in range(0, len(words), chunk_size):
+                    piece = words[start:start + chunk_size]
+                    if group and group_words + len(piece) > chunk_size:
+                        if not self._run_group(group):
+                            return
+                        group, group_words = [], 0
+                    group.append(' '.join(piece))
+                    group_words += len(piece)
             
-            # Metni oku
-            self.engine.say(text)
-            self.engine.runAndWait()
+            if group:
+                self._run_group(group)
             
         except Exception as e:
-            print(f"❌ TTS hatası: {e}")
+            logger.error("❌ TTS hatası: %s", e)
         
         finally:
             self.is_speaking = False
     
+    def _run_group(self, group: List[str]) -> bool:
+        """
+        Parça grubunu tek runAndWait() ile oku
+        
+        Returns:
+            bool: Okundu mu (acil uyarı geldiyse False)
+        """
+        if self._emergency_waiting():
+            return False
+        
+        for piece in group:
+            self.engine.say(piece)
+        self.engine.runAndWait()
+        return True
+    
+    def _with_repeat_count(self, alert_data: Dict, repeats: int) -> Dict:
+        """
+        Birleştirilen tekrar sayısını mesaja ekle ("..., 3 kez")
+        
+        Args:
+            alert_data: Kuyruktan alınan mesaj
+            repeats: Mesajın okunmayı beklerken kaç kez istendiği
+            
+        Returns:
+            Dict: Metni güncellenmiş mesaj kopyası
+        """
+        template = REPEAT_TEMPLATES.get(self.language, REPEAT_TEMPLATES['en'])
+        return {**alert_data, 'text': template.format(text=alert_data['text'].rstrip('.!?'), count=repeats)}
+    
+    def _enqueue(self, alert_data: Dict) -> bool:
+        """
+        Mesajı öncelik kuyruğuna ekle (çağıranı bloklamaz)
+        
+        Aynı metin zaten okunmayı bekliyorsa tekrar eklenmez, yalnızca
+        tekrar sayısı artırılır; TTS yetişemediğinde aynı uyarı kuyrukta
+        birikmez, okunurken kaç kez tekrarlandığı söylenir.
+        
+        Args:
+            alert_data: 'text', 'priority' ve 'type' alanlı mesaj
+            
+        Returns:
+            bool: Eklendi mi (yineleme veya kuyruk doluysa False)
+        """
+        text = alert_data['text']
+        queue = self.alert_queue
+        
+        # Yineleme kontrolü, yer açma ve ekleme tek kilit altında
+        with queue.mutex:
+            if text in self._pending:
+                self._pending[text] += 1
+                return False
+            
+            if 0 < queue.maxsize <= len(queue.queue):
+                # Önemli uyarı için en düşük öncelikli en eski mesajı at
+                if alert_data['priority'] < 2 or not self._drop_lowest(alert_data['priority']):
+                    return False
+            
+            heapq.heappush(queue.queue, (-alert_data['priority'], next(self._seq), alert_data))
+            queue.unfinished_tasks += 1
+            self._pending[text] = 1
+            queue.not_empty.notify()
+        return True
+    
+    def _drop_lowest(self, priority: int) -> bool:
+        """
+        Kuyruktaki en düşük öncelikli (eşitse en eski) mesajı sil
+        
+        alert_queue.mutex tutulurken çağrılır.
+        
+        Args:
+            priority: Yer açılmak istenen mesajın önceliği
+            
+        Returns:
+            bool: Daha düşük öncelikli bir mesaj silindi mi
+        """
+        heap = self.alert_queue.queue
+        candidates = [entry for entry in heap if entry[2] is not None]
+        if not candidates:
+            return False
+        
+        # Anahtar -öncelik olduğu için en büyük anahtar en düşük önceliktir
+        victim = max(candidates, key=lambda entry: (entry[0], -entry[1]))
+        if -victim[0] >= priority:
+            return False
+        
+        heap.remove(victim)
+        heapq.heapify(heap)
+        self.alert_queue.unfinished_tasks -= 1
+        self._pending.pop(victim[2]['text'], None)
+        return True
+    
+    def _throttled(self, key, interval: float, now: float) -> bool:
+        """
+        Anahtar için uyarı aralığı dolmadıysa True döndür (uyarıyı atla)
+        
+        Aralık dolduysa zaman damgasını günceller ve False döndürür.
+        Saat olarak time.monotonic() kullanılır; RTC'siz Raspberry Pi'de
+        açılıştaki NTP saat sıçramalarından etkilenmez.
+        
+        Args:
+            key: Throttling anahtarı ('direction', 'general_announce', ...)
+            interval: Minimum uyarı aralığı (saniye)
+            now: Çağıranın okuduğu time.monotonic() değeri
+            
+        Returns:
+            bool: Uyarı atlanmalı mı
+        """
+        last = self._throttle.get(key)
+        if last is not None and (now - last) < interval:
+            return True
+        
+        self._throttle[key] = now
+        return False
+    
+    def _emergency_waiting(self) -> bool:
+        """
+        Kuyrukta okunmayı bekleyen acil uyarı var mı (konuşmayı kesme koşulu)
+        
+        Ayrı bir işaret tutulmaz; acil uyarı kuyruktan alındığında
+        koşul kendiliğinden kalkar.
+        
+        Returns:
+            bool: Bekleyen acil uyarı durumu
+        """
+        with self.alert_queue.mutex:
+            return any(item and item.get('type') == 'emergency'
+                       for _, _, item in self.alert_queue.queue)
+    
+    def _has_pending_track(self, track_id) -> bool:
+        """
+        Kuyrukta bu track_id için bekleyen nesne uyarısı var mı
+        
+        Args:
+            track_id: Takip edilen nesnenin kimliği
+            
+        Returns:
+            bool: Bekleyen uyarı durumu
+        """
+        with self.alert_queue.mutex:
+            return any(item and item.get('track_id') == track_id
+                       for _, _, item in self.alert_queue.queue)
+    
+    def _compose_message(self, class_name: str, band, distance: float = None,
+                         language: str = None) -> tuple:
+        """
+        Nesne uyarı metnini ve aciliyetini oluştur
+        
+        Args:
+            class_name: Nesne sınıfı
+            band: DISTANCE_BAND_EDGES bant indeksi veya distance_level adı
+            distance: 0.5 m'ye yuvarlanmış uzaklık (bant verildiğinde)
+            language: Mesaj dili (None ise mevcut dil)
+            
+        Returns:
+            tuple: (metin, aciliyet)
+        """
+        language = language or self.language
+        
+        if isinstance(band, str):
+            lang_messages = self.messages.get(language, self.messages['en'])
+            base = lang_messages.get(class_name, f"{class_name} ahead" if language == 'en' else f"Önünüzde {class_name}")
+            template, urgency = LEVEL_TEMPLATES.get(band, ("{base}", 1))
+            return template.format(base=base), urgency
+        
+        key = (language, class_name, band, distance)
+        composed = self._distance_messages.get(key)
+        if composed is None:
+            lang_messages = self.messages.get(language, self.messages['en'])
+            base = lang_messages.get(class_name, f"{class_name} ahead" if language == 'en' else f"Önünüzde {class_name}")
+            templates = DISTANCE_TEMPLATES.get(language, DISTANCE_TEMPLATES['en'])
+            template, urgency = templates[band]
+            composed = (template.format(base=base, distance=distance), urgency)
+            
+            if len(self._distance_messages) >= COMPOSED_CACHE_LIMIT:
+                self._distance_messages.clear()
+            self._distance_messages[key] = composed
+        
+        return composed
+    
     def alert_close_object(self, detection: Dict):
         """
         Alert for close object with distance information
@@ -315,8 +1005,6 @@ class VoiceAlert:
         urgency = detection.get('urgency', 1)
         distance_meters = detection.get('distance_meters', None)
         
-        current_time = time.time()
-        
         # Check if this is a continuous alert for tracked object
         track_id = detection.get('track_id', None)
         should_alert = detection.get('should_alert', False)
@@ -326,85 +1014,38 @@ class VoiceAlert:
         if track_id and not should_alert and not should_distance_alert:
             return
         
+        # Aynı nesne için okunmayı bekleyen uyarı varsa yenisini ekleme
+        if track_id and self._has_pending_track(track_id):
+            return
+        
         # Legacy throttling for non-tracked objects
         if not track_id:
-            last_alert_key = f"{class_name}_{distance_level}"
-            if last_alert_key in self.last_alerts:
-                time_since_last = current_time - self.last_alerts[last_alert_key]
-                min_interval = self.config.ALERT_INTERVAL / max(urgency, 1)
-                
-                if time_since_last < min_interval:
+            min_interval = self.config.ALERT_INTERVAL / max(urgency, 1)
+            now = self._now()
+            i = self._alert_idx.get((class_name, distance_level))
+            if i is None:
+                # Tabloda olmayan sınıf/seviye: genel throttling sözlüğü
+                if self._throttled((class_name, distance_level), min_interval, now):
                     return
-            
-            self.last_alerts[last_alert_key] = current_time
-        
-        # Create message with distance information (language-aware)
-        lang_messages = self.messages.get(self.language, self.messages['en'])
-        base_message = lang_messages.get(class_name, f"{class_name} ahead" if self.language == 'en' else f"Önünüzde {class_name}")
+            elif (now - self._last_alert_ts[i]) < min_interval:
+                return
+            else:
+                self._last_alert_ts[i] = now
         
-        # Add detailed distance information to message (language-aware)
+        # Mesajı hazır metin tablosundan al (yoksa bir kez oluşturulur)
         if distance_meters:
             # Round distance to nearest 0.5 meters for clearer speech
             rounded_distance = round(distance_meters * 2) / 2
-            
-            if self.language == 'tr':
-                # Turkish distance messages
-                if distance_meters < 1:
-                    distance_desc = f"çok yakın, bir metreden az"
-                    message = f"Tehlike! {base_message}, {distance_desc}"
-                    urgency = 3
-                elif distance_meters < 2:
-                    distance_desc = f"çok yakın, {rounded_distance} metre"
-                    message = f"Dikkat! {base_message}, {distance_desc}"
-                    urgency = 3
-                elif distance_meters < 4:
-                    distance_desc = f"yakın, {rounded_distance} metre"
-                    message = f"Uyarı! {base_message}, {distance_desc}"
-                    urgency = 2
-                elif distance_meters < 8:
-                    distance_desc = f"{rounded_distance} metre uzaklıkta"
-                    message = f"{base_message}, {distance_desc}"
-                    urgency = 1
-                else:
-                    distance_desc = f"uzak, {rounded_distance} metre"
-                    message = f"{base_message}, {distance_desc}"
-                    urgency = 1
-            else:
-                # English distance messages
-                if distance_meters < 1:
-                    distance_desc = f"very close, less than one meter"
-                    message = f"Danger! {base_message}, {distance_desc}"
-                    urgency = 3
-                elif distance_meters < 2:
-                    distance_desc = f"very close, {rounded_distance} meters"
-                    message = f"Warning! {base_message}, {distance_desc}"
-                    urgency = 3
-                elif distance_meters < 4:
-                    distance_desc = f"close, {rounded_distance} meters"
-                    message = f"Caution! {base_message}, {distance_desc}"
-                    urgency = 2
-                elif distance_meters < 8:
-                    distance_desc = f"{rounded_distance} meters away"
-                    message = f"{base_message}, {distance_desc}"
-                    urgency = 1
-                else:
-                    distance_desc = f"far, {rounded_distance} meters away"
-                    message = f"{base_message}, {distance_desc}"
-                    urgency = 1
+            band = bisect_right(DISTANCE_BAND_EDGES, distance_meters)
+            message, urgency = self._compose_message(class_name, band, rounded_distance)
         else:
             # Fallback to distance level
-            if distance_level == 'very_close':
-                message = f"Warning! {base_message}, very close"
-                urgency = 3
-            elif distance_level == 'close':
-                message = f"Caution! {base_message}"
-                urgency = 2
-            else:
-                message = base_message
-                urgency = 1
+            message, urgency = self._composed.get(
+                (self.language, class_name, distance_level)) or self._compose_message(
+                class_name, distance_level)
         
         # Add to queue
-        self.alert_queue.put({
+        self._enqueue({
             'text': message,
             'priority': urgency,
             'type': 'object_alert',
@@ -412,7 +1053,7 @@ class VoiceAlert:
         })
         
         if self.config.DEBUG_MODE:
-            print(f"🔊 Voice alert: {message}")
+            logger.info("🔊 Voice alert: %s", message)
     
     def give_direction(self, direction: str):
         """
@@ -424,23 +1065,22 @@ class VoiceAlert:
         if not self.is_enabled:
             return
         
-        current_time = time.time()
-        
         # Yön uyarıları için throttling
-        if (current_time - self.last_direction_alert) < self.config.DIRECTION_ALERT_INTERVAL:
+        if self._throttled('direction', self.config.DIRECTION_ALERT_INTERVAL, self._now()):
             return
         
         message_key = f'turn_{direction}' if direction in ['left', 'right'] else direction
-        message = self.messages.get(message_key, f"{direction} yönüne gidin")
+        # Varsayılan metin yalnızca anahtar yoksa oluşturulur
+        message = self.messages.get(self.language, self.messages['en']).get(message_key)
+        if message is None:
+            message = f"{direction} yönüne gidin"
         
         # Kuyruğa ekle (yüksek öncelik)
-        self.alert_queue.put({
+        self._enqueue({
             'text': message,
             'priority': 3,
             'type': 'direction_alert'
         })
-        
-        self.last_direction_alert = current_time
     
     def announce_objects(self, detections: List[Dict]):
         """
@@ -452,52 +1092,75 @@ class VoiceAlert:
         if not self.is_enabled or not detections:
             return
         
-        current_time = time.time()
-        
         # Genel nesne duyurusu için throttling
-        if (current_time - self.last_alerts.get('general_announce', 0)) < self.config.GENERAL_ANNOUNCE_INTERVAL:
+        if self._throttled('general_announce', self.config.GENERAL_ANNOUNCE_INTERVAL, self._now()):
             return
         
         # Nesne türlerini say
-        object_types = {}
-        for detection in detections:
-            class_name = detection['class_name']
-            object_types[class_name] = object_types.get(class_name, 0) + 1
+        object_types = Counter(detection['class_name'] for detection in detections)
+        
+        self._announce_counts(object_types.most_common(), len(detections))
+    
+    def announce_objects_ids(self, class_ids: np.ndarray, class_names: Dict[int, str]):
+        """
+        Sınıf ID dizisinden nesneleri duyur (throttled)
+        
+        Algılamalar dizi olarak tutuluyorsa sözlük listesi kurmadan tek
+        np.bincount ile sayılır.
+        
+        Args:
+            class_ids: Algılanan nesnelerin sınıf ID'leri (int dizisi)
+            class_names: Sınıf ID -> isim eşlemesi (ObjectDetector.target_classes)
+        """
+        if not self.is_enabled or len(class_ids) == 0:
+            return
         
+        if self._throttled('general_announce', self.config.GENERAL_ANNOUNCE_INTERVAL, self._now()):
+            return
+        
+        counts = np.bincount(class_ids)
+        present = np.flatnonzero(counts)
+        present = present[np.argsort(-counts[present], kind='stable')]
+        
+        self._announce_counts([(class_names.get(int(i), str(i)), int(counts[i])) for i in present],
+                              len(class_ids))
+    
+    def _announce_counts(self, ranked: List, total: int):
+        """
+        Sayılmış nesne türlerinden duyuru mesajını oluşturup kuyruğa ekle
+        
+        Args:
+            ranked: Çoktan aza sıralı (sınıf_adı, adet) listesi
+            total: Toplam nesne sayısı
+        """
         # Mesaj oluştur
-        if len(object_types) == 1:
-            class_name = list(object_types.keys())[0]
-            count = object_types[class_name]
+        if len(ranked) == 1:
+            class_name, count = ranked[0]
             
             if count == 1:
-                message = self.messages.get(class_name, f"Önünüzde {class_name} var")
+                message = self.messages.get(self.language, self.messages['en']).get(class_name)
+                if message is None:
+                    message = f"Önünüzde {class_name} var"
             else:
                 message = f"Önünüzde {count} adet {class_name} var"
         
-        elif len(object_types) <= 3:
-            # Az sayıda nesne türü varsa hepsini söyle
-            object_list = []
-            for class_name, count in object_types.items():
-                if count == 1:
-                    object_list.append(class_name)
-                else:
-                    object_list.append(f"{count} {class_name}")
-            
-            message = f"Önünüzde {', '.join(object_list)} var"
-        
         else:
-            # Çok fazla nesne türü varsa genel mesaj
-            total_count = sum(object_types.values())
-            message = f"Önünüzde {total_count} farklı nesne tespit edildi"
+            # En sık görülen en fazla 3 nesne türünü söyle (tek join, ara liste yok)
+            listed = ', '.join(class_name if count == 1 else f"{count} {class_name}"
+                               for class_name, count in islice(ranked, 3))
+            
+            if len(ranked) <= 3:
+                message = f"Önünüzde {listed} var"
+            else:
+                # Çok fazla nesne türü varsa toplam sayıyı da ekle
+                message = f"Önünüzde {listed} dahil {total} nesne var"
         
         # Kuyruğa ekle (düşük öncelik)
-        self.alert_queue.put({
+        self._enqueue({
             'text': message,
             'priority': 1,
             'type': 'general_announce'
         })
-        
-        self.last_alerts['general_announce'] = current_time
     
     def emergency_alert(self, message: str):
         """
@@ -510,11 +1173,13 @@ class VoiceAlert:
             return
         
         # Emergency message - add to queue immediately
-        self.alert_queue.put({
-            'text': f"EMERGENCY! {message}",
-            'priority': 3,
+        self._enqueue({
+            'text': f"{EMERGENCY_PREFIX}{message}",
+            'priority': 4,  # Yön ve yakın nesne uyarılarının (3) da önünde
             'type': 'emergency'
         })
+        # The queued emergency interrupts the current utterance at the
+        # next chunk boundary (see _emergency_waiting)
     
     def announce_distance_details(self, detections: List[Dict]):
         """
@@ -526,18 +1191,13 @@ class VoiceAlert:
         if not self.is_enabled or not detections:
             return
         
-        current_time = time.time()
-        
-        # Throttle detailed distance announcements
-        if (current_time - self.last_alerts.get('distance_details', 0)) < 15:
-            return
-        
         # Find closest object
         closest_obj = min(detections, key=lambda x: x.get('distance_meters', 999))
         distance = closest_obj.get('distance_meters', 0)
         class_name = closest_obj.get('class_name', 'object')
         
-        if distance > 0:
+        # Throttle detailed distance announcements
+        if distance > 0 and not self._throttled('distance_details', 15, self._now()):
             rounded_distance = round(distance * 2) / 2
             
             # Create detailed distance announcement
@@ -549,16 +1209,14 @@ class VoiceAlert:
                 message = f"Closest object: {class_name} at {rounded_distance} meters. Safe distance."
             
             # Add to queue with medium priority
-            self.alert_queue.put({
+            self._enqueue({
                 'text': message,
                 'priority': 2,
                 'type': 'distance_details'
             })
             
-            self.last_alerts['distance_details'] = current_time
-            
             if self.config.DEBUG_MODE:
-                print(f"🔊 Distance details: {message}")
+                logger.info("🔊 Distance details: %s", message)
     
     def system_message(self, message_key: str):
         """
@@ -567,16 +1225,21 @@ class VoiceAlert:
         Args:
             message_key: Mesaj anahtarı
         """
-        message = self.messages.get(message_key, message_key)
+        message = self.messages.get(self.language, self.messages['en']).get(message_key, message_key)
         
-        self.alert_queue.put({
+        self._enqueue({
             'text': message,
             'priority': 2,
             'type': 'system'
         })
     
     def toggle_sound(self):
-        """Sesi aç/kapat"""
+        """Sesi aç/kapat (TTS kapalıysa veya motor yoksa açılmaz)"""
+        if not self.is_enabled and (not self.config.TTS_ENABLED or
+                                    (self.engine is None and self._piper_voice is None)):
+            print("⚠️ TTS motoru yok (TTS_ENABLED kapalı veya başlatılamadı), ses açılamıyor")
+            return
+        
         self.is_enabled = not self.is_enabled
         
         if self.is_enabled:
@@ -613,13 +1276,15 @@ class VoiceAlert:
             print(f"🗣️ Konuşma hızı ayarlandı: {rate} kelime/dakika")
     
     def clear_queue(self):
-        """Uyarı kuyruğunu temizle"""
-        while not self.alert_queue.empty():
-            try:
-                self.alert_queue.get_nowait()
-                self.alert_queue.task_done()
-            except Empty:
-                break
+        """Uyarı kuyruğunu temizle (kuyruk kilidi altında tek adımda)"""
+        with self.alert_queue.mutex:
+            # Worker'ın elindeki mesajın task_done() çağrısı geçerli kalsın
+            self.alert_queue.unfinished_tasks -= len(self.alert_queue.queue)
+            self.alert_queue.queue.clear()
+            if self.alert_queue.unfinished_tasks == 0:
+                self.alert_queue.all_tasks_done.notify_all()
+            self.alert_queue.not_full.notify_all()
+            self._pending.clear()
         
         print("🧹 Sesli uyarı kuyruğu temizlendi")
     
@@ -630,7 +1295,7 @@ class VoiceAlert:
         Returns:
             bool: Kuyruk durumu
         """
-        return self.alert_queue.qsize() >= self.config.MAX_ALERT_QUEUE_SIZE
+        return self.alert_queue.full()
     
     def get_queue_size(self) -> int:
         """
@@ -645,14 +1310,22 @@ class VoiceAlert:
         """Kaynakları temizle"""
         print("🧹 Sesli uyarı sistemi kapatılıyor...")
         
-        # Thread'i durdur
+        # Thread'i durdur (None mesajı bloklanan get() çağrısını uyandırır)
         self.stop_thread = True
         if self.worker_thread and self.worker_thread.is_alive():
+            try:
+                self.alert_queue.put((float('-inf'), next(self._seq), None), timeout=2.0)
+            except Full:
+                pass
             self.worker_thread.join(timeout=2.0)
         
         # Kuyruğu temizle
         self.clear_queue()
         
+        # Piper sentez havuzunu kapat
+        if self._synth_pool:
+            self._synth_pool.shutdown(wait=False)
+        
         # TTS motorunu kapat
         if self.engine:
             try:
@@ -674,7 +1347,7 @@ class VoiceAlert:
         else:
             test_message = "Voice test. System is working."
             
-        self.alert_queue.put({
+        self._enqueue({
             'text': test_message,
             'priority': 2,
             'type': 'test'
@@ -709,7 +1382,7 @@ class VoiceAlert:
         else:
             announce_msg = "Language switched to English"
             
-        self.alert_queue.put({
+        self._enqueue({
             'text': announce_msg,
             'priority': 2,
             'type': 'language_change'
@@ -5,18 +5,29 @@ Continuous Alerts Test Script
 Simple test to verify continuous voice alerts are working
 """
 
+import numpy as np
 import time
 import threading
 import sys
+from queue import Queue, Full
 from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from assistive_vision.voice_alert import VoiceAlert
+from assistive_vision.voice_alert import VoiceAlert, start_queued_logging
 from assistive_vision.config import Config
 
+def alert_interval_for(distance):
+    """Alert interval in seconds for an object at the given distance"""
+    if distance < 3:
+        return 3.0
+    elif distance < 6:
+        return 6.0
+    else:
+        return 10.0
+
 def test_continuous_alerts():
     """Test continuous voice alerts with simulated objects"""
     
@@ -62,48 +73,62 @@ def test_continuous_alerts():
     print("- Bicycle at 10.0m (every 10-12 seconds)")
     print("\nPress Ctrl+C to stop\n")
     
+    # Single worker thread feeds alerts to VoiceAlert; a full queue drops
+    # the alert so TTS backpressure never stalls the simulation
+    alert_queue = Queue(maxsize=len(test_objects))
+    
+    def drain_alerts():
+        while True:
+            obj = alert_queue.get()
+            if obj is None:
+                break
+            voice_alert.alert_close_object(obj)
+    
+    alert_worker = threading.Thread(target=drain_alerts, daemon=True)
+    alert_worker.start()
+    
+    # Next-fire table: one slot per object, the loop sleeps until the
+    # earliest due time and dispatches every object that is due
+    intervals = np.array([alert_interval_for(obj['distance_meters']) for obj in test_objects])
+    start_time = time.monotonic()
+    end_time = start_time + 60  # Run for 60 seconds
+    next_fire = np.full(len(test_objects), start_time)
+    
     try:
-        # Run for 60 seconds
-        start_time = time.time()
-        last_alerts = {}
-        
-        while (time.time() - start_time) < 60:
-            current_time = time.time()
+        while True:
+            now = time.monotonic()
+            if now >= end_time:
+                break
             
-            for obj in test_objects:
-                track_id = obj['track_id']
-                distance = obj['distance_meters']
+            for i in np.flatnonzero(now >= next_fire):
+                obj = test_objects[i]
+                next_fire[i] += intervals[i]
                 
-                # Determine alert interval based on distance
-                if distance < 3:
-                    alert_interval = 3.0
-                elif distance < 6:
-                    alert_interval = 6.0
-                else:
-                    alert_interval = 10.0
+                # Hand alert to the worker thread
+                try:
+                    alert_queue.put_nowait(obj)
+                except Full:
+                    continue
                 
-                # Check if it's time to alert
-                last_time = last_alerts.get(track_id, 0)
-                if (current_time - last_time) >= alert_interval:
-                    last_alerts[track_id] = current_time
-                    
-                    # Send alert in separate thread
-                    threading.Thread(
-                        target=voice_alert.alert_close_object,
-                        args=(obj,),
-                        daemon=True
-                    ).start()
-                    
-                    print(f"🔊 Alert sent: {obj['class_name']} ID:{track_id} at {distance}m")
+                print(f"🔊 Alert sent: {obj['class_name']} ID:{obj['track_id']} at {obj['distance_meters']}m")
             
-            time.sleep(0.5)  # Check every 0.5 seconds
+            time.sleep(max(0.0, min(next_fire.min(), end_time) - time.monotonic()))
     
     except KeyboardInterrupt:
         print("\n🛑 Test stopped by user")
     
     finally:
+        # Blocking put: the worker frees a slot as it drains, so the stop
+        # message is never lost on a full queue
+        try:
+            alert_queue.put(None, timeout=5.0)
+        except Full:
+            print("⚠️ Alert worker did not drain the queue")
+        alert_worker.join(timeout=5.0)
         voice_alert.cleanup()
         print("✅ Test completed")
 
 if __name__ == "__main__":
+    # Debug alert lines go through logging; pytest shows them with --log-cli-level=INFO
+    start_queued_logging()
     test_continuous_alerts()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Object Detector Batch Tests
+detect_objects_batch with a stub model (no YOLO weights needed)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from assistive_vision import object_detector
+from assistive_vision.config import Config
+from assistive_vision.object_detector import ObjectDetector
+
+
+class StubBox:
+    """Single box in the shape Ultralytics exposes after .cpu().numpy()"""
+
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = np.array([xyxy], dtype=np.float32)
+        self.conf = np.array([conf], dtype=np.float32)
+        self.cls = np.array([cls], dtype=np.float32)
+
+
+class StubBoxes(list):
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self
+
+
+class StubResult:
+    def __init__(self, boxes):
+        self.boxes = StubBoxes(boxes)
+
+
+class StubModel:
+    """Returns one canned result per input frame and records the call"""
+
+    def __init__(self, per_frame):
+        self.per_frame = per_frame
+        self.calls = []
+
+    def __call__(self, frames, **kwargs):
+        self.calls.append((len(frames), kwargs))
+        return [StubResult(boxes) for boxes in self.per_frame[:len(frames)]]
+
+
+def make_detector(monkeypatch, model):
+    monkeypatch.setattr(ObjectDetector, 'initialize_model', lambda self: False)
+    detector = ObjectDetector(Config())
+    detector.model = model
+    return detector
+
+
+def test_batch_returns_results_per_frame(monkeypatch):
+    model = StubModel([
+        [StubBox((10, 20, 50, 80), 0.9, 0)],                                # person
+        [],
+        [StubBox((0, 0, 30, 30), 0.8, 2), StubBox((5, 5, 9, 9), 0.7, 27)],  # car + untargeted tie
+    ])
+    detector = make_detector(monkeypatch, model)
+    frames = [np.zeros((48, 64, 3), dtype=np.uint8) for _ in range(3)]
+
+    results = detector.detect_objects_batch(frames)
+
+    # One model call for the whole batch
+    assert len(model.calls) == 1
+    assert model.calls[0][0] == 3
+    assert model.calls[0][1]['imgsz'] == detector.config.YOLO_IMAGE_SIZE
+
+    assert [len(r) for r in results] == [1, 0, 1]
+    person = results[0][0]
+    assert person['class_name'] == 'person'
+    assert person['bbox'] == (10, 20, 50, 80)
+    assert person['center'] == (30, 50)
+    assert person['area'] == 40 * 60
+    assert results[2][0]['class_name'] == 'car'
+
+
+def test_fixed_shape_export_runs_one_frame_per_call(monkeypatch):
+    per_frame = [[StubBox((10, 20, 50, 80), 0.9, 0)], [StubBox((0, 0, 30, 30), 0.8, 2)]]
+    calls = []
+
+    def static_model(frames, **kwargs):
+        # Behaves like a static batch-1 export
+        assert len(frames) == 1
+        calls.append(len(frames))
+        return [StubResult(per_frame[len(calls) - 1])]
+
+    detector = make_detector(monkeypatch, static_model)
+    detector.fixed_batch = True
+    frames = [np.zeros((48, 64, 3), dtype=np.uint8) for _ in range(2)]
+
+    results = detector.detect_objects_batch(frames)
+
+    assert calls == [1, 1]
+    assert [r[0]['class_name'] for r in results] == ['person', 'car']
+
+
+def test_batch_without_model_or_frames(monkeypatch):
+    detector = make_detector(monkeypatch, None)
+    frames = [np.zeros((4, 4, 3), dtype=np.uint8)] * 2
+
+    assert detector.detect_objects_batch(frames) == [[], []]
+    assert detector.detect_objects_batch([]) == []
+
+
+def test_batch_model_error_gives_empty_results(monkeypatch):
+    def failing_model(frames, **kwargs):
+        raise RuntimeError("inference failed")
+
+    detector = make_detector(monkeypatch, failing_model)
+    frames = [np.zeros((4, 4, 3), dtype=np.uint8)] * 3
+
+    assert detector.detect_objects_batch(frames) == [[], [], []]
+
+
+def test_detect_objects_bad_frame_gives_empty_results(monkeypatch):
+    detector = make_detector(monkeypatch, StubModel([]))
+
+    assert detector.detect_objects(np.zeros((0, 0, 3), dtype=np.uint8)) == []
+    assert detector.detect_objects(None) == []
+
+
+class StubExporter:
+    """Stands in for YOLO(...) during export; writes the default output file"""
+
+    calls = []
+
+    def __init__(self, model_path, **kwargs):
+        self.model_path = Path(model_path)
+
+    def export(self, **kwargs):
+        StubExporter.calls.append(kwargs)
+        output = self.model_path.with_suffix('.onnx')
+        output.write_bytes(b'')
+        return str(output)
+
+
+def test_export_name_matches_precision_actually_used(monkeypatch, tmp_path):
+    monkeypatch.setattr(object_detector, 'YOLO', StubExporter, raising=False)
+    monkeypatch.setattr(object_detector, 'cuda_available', lambda: False)
+    detector = make_detector(monkeypatch, None)
+    detector.config.YOLO_EXPORT_FORMAT = 'onnx'
+    detector.config.YOLO_IMAGE_SIZE = 416
+    source = tmp_path / "yolov8n.pt"
+
+    # ONNX ignores INT8 and CPU export drops FP16: the file is FP32
+    detector.config.YOLO_EXPORT_INT8 = True
+    detector.config.YOLO_EXPORT_HALF = True
+    StubExporter.calls = []
+    path = detector.resolve_model_path(str(source))
+
+    assert Path(path).name == "yolov8n_416_fp32.onnx"
+    assert StubExporter.calls[0]['int8'] is False
+    assert StubExporter.calls[0]['half'] is False
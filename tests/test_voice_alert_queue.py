@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Voice Alert Queue Tests
+Deduplication, repeat counts, eviction and shutdown of the alert queue
+(TTS engine stubbed, nothing is spoken)
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from assistive_vision.config import Config
+from assistive_vision.voice_alert import VoiceAlert
+
+
+class StubEngine:
+    """Records what would be spoken, one entry per runAndWait()"""
+
+    def __init__(self):
+        self.pending = []
+        self.spoken = []
+
+    def say(self, text):
+        self.pending.append(text)
+
+    def runAndWait(self):
+        self.spoken.append(' '.join(self.pending))
+        self.pending = []
+
+    def setProperty(self, name, value):
+        pass
+
+    def stop(self):
+        pass
+
+
+def make_voice_alert(queue_size=10):
+    """VoiceAlert with a stub engine and its worker stopped"""
+    config = Config()
+    config.TTS_ENABLED = False          # no real TTS initialisation
+    config.MAX_ALERT_QUEUE_SIZE = queue_size
+    config.TTS_BARGE_CHUNK_WORDS = 100  # one say() per message
+    config.TTS_BURST_SIZE = 1           # one message per runAndWait()
+
+    voice = VoiceAlert(config)
+    voice.cleanup()                     # queue is filled while no worker runs
+    voice.engine = StubEngine()
+    voice.is_enabled = True
+    return voice
+
+
+def alert(text, priority=1):
+    return {'text': text, 'priority': priority, 'type': 'test'}
+
+
+def queued_texts(voice):
+    return [item['text'] for _, _, item in sorted(voice.alert_queue.queue)]
+
+
+def drain(voice, timeout=5.0):
+    """Start the worker, wait until the queue is processed, then stop it"""
+    voice.start_worker_thread()
+    done = threading.Thread(target=voice.alert_queue.join, daemon=True)
+    done.start()
+    done.join(timeout)
+    assert not done.is_alive(), "alert_queue.join() did not return"
+    voice.cleanup()
+
+
+def test_duplicate_text_is_queued_once_and_counted():
+    voice = make_voice_alert()
+
+    assert voice._enqueue(alert("Sola dönün"))
+    assert not voice._enqueue(alert("Sola dönün"))
+    assert not voice._enqueue(alert("Sola dönün"))
+    assert voice._enqueue(alert("Durun"))
+
+    assert queued_texts(voice) == ["Sola dönün", "Durun"]
+    assert voice._pending == {"Sola dönün": 3, "Durun": 1}
+
+
+def test_repeat_count_is_spoken_and_reset():
+    voice = make_voice_alert()
+    voice.language = 'tr'
+    for _ in range(3):
+        voice._enqueue(alert("Önünüzde insan."))
+    voice._enqueue(alert("Durun"))
+
+    drain(voice)
+
+    assert voice.engine.spoken == ["Önünüzde insan, 3 kez", "Durun"]
+    assert voice._pending == {}
+
+
+def test_full_queue_evicts_oldest_lowest_priority():
+    voice = make_voice_alert(queue_size=3)
+    voice._enqueue(alert("low-a", 1))
+    voice._enqueue(alert("low-b", 1))
+    voice._enqueue(alert("mid", 2))
+
+    # Low priority never evicts
+    assert not voice._enqueue(alert("low-c", 1))
+
+    # Higher priority evicts the oldest of the lowest priority
+    assert voice._enqueue(alert("high", 3))
+    assert queued_texts(voice) == ["high", "mid", "low-b"]
+    assert "low-a" not in voice._pending
+
+    voice._enqueue(alert("high-2", 3))
+    assert queued_texts(voice) == ["high", "high-2", "mid"]
+
+    # Equal priority is not evicted
+    voice._enqueue(alert("high-3", 3))
+    assert queued_texts(voice) == ["high", "high-2", "high-3"]
+    assert not voice._enqueue(alert("high-4", 3))
+
+    assert voice.alert_queue.unfinished_tasks == 3
+
+
+def test_join_returns_after_eviction():
+    voice = make_voice_alert(queue_size=2)
+    voice._enqueue(alert("low-a", 1))
+    voice._enqueue(alert("low-b", 1))
+    voice._enqueue(alert("urgent", 3))
+
+    drain(voice)
+
+    assert voice.engine.spoken == ["urgent", "low-b"]
+    assert voice.alert_queue.unfinished_tasks == 0
+
+
+def test_pending_track_skips_new_alert_for_same_object():
+    voice = make_voice_alert()
+    detection = {'class_name': 'person', 'track_id': 7, 'should_alert': True,
+                 'distance_meters': 2.0}
+
+    voice.alert_close_object(detection)
+    voice.alert_close_object({**detection, 'distance_meters': 1.5})
+
+    assert len(voice.alert_queue.queue) == 1
+    assert voice._has_pending_track(7)
+    assert not voice._has_pending_track(8)
+
+
+def test_cleanup_stops_worker_and_clears_queue():
+    voice = make_voice_alert()
+    voice.start_worker_thread()
+    worker = voice.worker_thread
+    assert worker.is_alive()
+
+    voice.cleanup()
+
+    assert not worker.is_alive()
+    assert voice.alert_queue.qsize() == 0
+    assert voice._pending == {}
+
+
+def test_alerts_after_emergency_are_spoken():
+    voice = make_voice_alert()
+    voice.emergency_alert("fire")
+
+    drain(voice)
+    assert voice.engine.spoken == ["EMERGENCY! fire"]
+    assert not voice._emergency_waiting()
+
+    # Emergency already spoken: nothing left to interrupt the next alerts
+    for text in ("Person ahead", "Turn left", "Stop"):
+        voice._enqueue(alert(text, 2))
+    drain(voice)
+
+    assert voice.engine.spoken == ["EMERGENCY! fire", "Person ahead", "Turn left", "Stop"]
+
+
+def test_queued_emergency_skips_other_alerts_in_burst():
+    voice = make_voice_alert()
+    voice.config.TTS_BURST_SIZE = 5
+    voice._enqueue(alert("Person ahead", 2))
+    voice.emergency_alert("fire")
+
+    drain(voice)
+
+    assert voice.engine.spoken == ["EMERGENCY! fire"]
@@ -5,14 +5,28 @@ Windows Test Scripti
 Raspberry Pi Engelli Destek Sistemi'ni Windows'ta test etmek için
 """
 
+import os
+
+# Hesaplama thread bütçesi: yakalama ve gösterim için iki çekirdek ayrılır.
+# OpenMP/MKL ayarları NumPy ve torch yüklenmeden önce yapılmalı; yalnızca
+# betik olarak çalıştırıldığında uygulanır (pytest içe aktarınca değil).
+RESERVED_CORES = 2
+COMPUTE_THREADS = max(1, (os.cpu_count() or 1) - RESERVED_CORES)
+if __name__ == "__main__":
+    os.environ.setdefault('OMP_NUM_THREADS', str(COMPUTE_THREADS))
+    os.environ.setdefault('MKL_NUM_THREADS', str(COMPUTE_THREADS))
+
 import cv2
 import numpy as np
+import re
 import time
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty, Full
 from typing import Dict, List
 from pathlib import Path
 import sys
-import os
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
@@ -21,9 +35,9 @@ if str(SRC_DIR) not in sys.path:
 
 # Module imports (with error handling)
 try:
-    from assistive_vision.object_detector import ObjectDetector
+    from assistive_vision.object_detector import ObjectDetector, cuda_available
     from assistive_vision.distance_checker import DistanceChecker
-    from assistive_vision.voice_alert import VoiceAlert
+    from assistive_vision.voice_alert import VoiceAlert, start_queued_logging
     from assistive_vision.navigation_guide import NavigationGuide
     from assistive_vision.object_tracker import ObjectTracker
     from assistive_vision.detection_logger import DetectionLogger
@@ -34,6 +48,118 @@ except ImportError as e:
     print("Running in basic test mode...")
     MODULES_AVAILABLE = False
 
+# Uzaklık kademeleri: 0 = <3m tehlikeli, 1 = 3-6m dikkat, 2 = >6m güvenli
+DISTANCE_TIER_EDGES = np.array([3.0, 6.0], dtype=np.float32)
+TIER_BOX_THICKNESS = np.array([4, 3, 2], dtype=np.int32)
+TIER_RING_RADIUS = np.array([30, 20, 15], dtype=np.int32)
+TIER_RING_THICKNESS = np.array([3, 2, 2], dtype=np.int32)
+TIER_RING_COLORS = ((0, 0, 255), (0, 255, 255), (0, 255, 0))  # Red, Yellow, Green
+TIER_ALERT_INTERVAL = (3.0, 6.0, 10.0)  # Sürekli uyarı aralığı (saniye)
+
+# Demo TensorRT motorunu yalnızca açıkça istenirse kullanır
+USE_TENSORRT = os.getenv("USE_TENSORRT", "false").lower() == "true"
+
+DEMO_WINDOW_NAME = 'Raspberry Pi Engelli Destek Sistemi - HD Test'
+
+# Demo döngüsü hedef kare hızı ve FPS ölçüm penceresi (kare)
+DEMO_TARGET_FPS = 30
+FPS_WINDOW_FRAMES = 60
+
+# Algılama aralıkları (saniye): YOLO ~3 Hz, demo verisi 1 Hz
+INFER_PERIOD = 10 / DEMO_TARGET_FPS
+DEMO_REFRESH_PERIOD = 30 / DEMO_TARGET_FPS
+
+# Uyarı havuzunda bekleyebilecek en fazla iş (fazlası atlanır)
+ALERT_POOL_MAX_PENDING = 3
+
+# Bu boyuttan (piksel) küçük kutulara takip yazısı/işareti çizilmez
+MIN_OVERLAY_SIZE = 24
+
+# Gösterilen karelerin geri dönüştürüldüğü havuzun boyutu
+FRAME_POOL_SIZE = 4
+
+# Etiket ölçüsü önbelleğinin üst sınırı (canlı modda etiketler değişebilir)
+TEXTSIZE_CACHE_LIMIT = 512
+
+# Türkçe TTS sesi eşleştirme (id veya ad, büyük/küçük harf duyarsız)
+TURKISH_VOICE_ID = re.compile(r'tr', re.IGNORECASE)
+TURKISH_VOICE_NAME = re.compile(r'turkish', re.IGNORECASE)
+
+# Demo algılama kaydı (class_name ayrı listede tutulur)
+DEMO_DETECTION_DTYPE = np.dtype([
+    ('class_id', 'i4'),
+    ('confidence', 'f8'),
+    ('x1', 'i4'),
+    ('y1', 'i4'),
+    ('x2', 'i4'),
+    ('y2', 'i4'),
+    ('distance', 'f8'),
+])
+
+# Demo nesne renkleri (BGR), COCO class_id ile indekslenir; son satır
+# tabloda olmayan sınıflar için gri
+CLASS_PALETTE = np.array([
+    (0, 255, 0),      # 0 person - Green
+    (255, 0, 0),      # 1 bicycle - Blue
+    (0, 0, 255),      # 2 car - Red
+    (128, 128, 128),  # Gray
+], dtype=np.int32)
+
+
+def distance_tiers(distances: np.ndarray) -> np.ndarray:
+    """
+    Uzaklık dizisini tehlike kademelerine çevir (vektörel)
+    
+    Args:
+        distances: Metre cinsinden uzaklıklar
+        
+    Returns:
+        np.ndarray: Her nesne için kademe indeksi (0-2)
+    """
+    return np.digitize(distances, DISTANCE_TIER_EDGES)
+
+
+def pin_current_thread(core: int):
+    """
+    Çağıran thread'i tek bir CPU çekirdeğine sabitle
+    
+    Linux'ta sched_setaffinity, Windows'ta SetThreadAffinityMask kullanılır;
+    desteklenmeyen sistemlerde sessizce atlanır.
+    
+    Args:
+        core: Çekirdek numarası
+    """
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            os.sched_setaffinity(0, {core})
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << core)
+    except (OSError, AttributeError):
+        pass
+
+
+def put_latest(target: Queue, item):
+    """
+    Kuyruğa en yeni öğeyi koy; kuyruk doluysa eski öğeyi at
+    
+    Args:
+        target: Sınırlı kuyruk
+        item: Eklenecek öğe
+    """
+    try:
+        target.put_nowait(item)
+    except Full:
+        try:
+            target.get_nowait()
+        except Empty:
+            pass
+        try:
+            target.put_nowait(item)
+        except Full:
+            pass
+
 
 class WindowsTestSystem:
     """Windows'ta test için basitleştirilmiş sistem"""
@@ -44,6 +170,31 @@ class WindowsTestSystem:
         
         self.cap = None
         self.running = False
+        self._use_opencl = False
+        
+        # OpenCV iç paralelliği ayrılan çekirdekleri kullanmasın
+        cv2.setNumThreads(COMPUTE_THREADS)
+        
+        # Statik demo arka planı önbelleği: (yükseklik, genişlik) -> (frame, maske)
+        self._bg_templates = {}
+        
+        # Son çizilen demo karesi ve onu üreten algılama anahtarı
+        self._last_demo_key = None
+        self._last_demo_frame = None
+        
+        # Demo çizim tamponu (boyut değişmedikçe yeniden ayrılmaz)
+        self._scratch_frame = None
+        
+        # imshow'dan dönen kareler burada bekler, demo kareleri bunlara kopyalanır
+        self._frame_pool = Queue(maxsize=FRAME_POOL_SIZE)
+        
+        # Sesli uyarı çağrıları için tek işçili havuz (uyarı başına thread yok)
+        self._alert_pool = ThreadPoolExecutor(max_workers=1)
+        # Havuzdaki (bekleyen + çalışan) iş sayısı sınırı; iş bitince serbest kalır
+        self._alert_slots = threading.BoundedSemaphore(ALERT_POOL_MAX_PENDING + 1)
+        
+        # Etiket ölçüleri önbelleği: (metin, ölçek, kalınlık) -> (genişlik, yükseklik)
+        self._textsize_cache = {}
         
         # Konfigürasyon
         if MODULES_AVAILABLE:
@@ -51,42 +202,48 @@ class WindowsTestSystem:
             self.config.SHOW_DISPLAY = True
             self.config.DEBUG_MODE = True
         
-        # Demo verisi
-        self.demo_detections = [
-            {
-                'class_id': 0,
-                'class_name': 'person',
-                'confidence': 0.85,
-                'bbox': (200, 250, 400, 550),  # Yakın insan
-                'center': (300, 400),
-                'width': 200,
-                'height': 300,
-                'area': 60000,
-                'distance_meters': 2.5  # 2.5 metre uzaklık
-            },
-            {
-                'class_id': 2,
-                'class_name': 'car',
-                'confidence': 0.92,
-                'bbox': (600, 350, 1000, 550),  # Uzak araba
-                'center': (800, 450),
-                'width': 400,
-                'height': 200,
-                'area': 80000,
-                'distance_meters': 8.0  # 8 metre uzaklık
-            },
-            {
-                'class_id': 1,
-                'class_name': 'bicycle',
-                'confidence': 0.78,
-                'bbox': (50, 400, 150, 500),  # Sol tarafta bisiklet
-                'center': (100, 450),
-                'width': 100,
-                'height': 100,
-                'area': 10000,
-                'distance_meters': 5.0  # 5 metre uzaklık
-            }
-        ]
+        # Kamera çalışana kadar demo modu; demo verisi ilk kullanımda yüklenir
+        self._demo_mode = True
+        self.demo_detections_np = None
+        self.demo_class_names = []
+    
+    def _ensure_demo_detections(self):
+        """Demo algılamalarını ilk ihtiyaçta oluştur (canlı modda hiç yüklenmez)"""
+        if self.demo_detections_np is not None:
+            return
+        
+        # Demo verisi (SoA: sayısal alanlar yapılandırılmış dizide)
+        self.demo_detections_np = np.array([
+            (0, 0.85, 200, 250, 400, 550, 2.5),    # Yakın insan, 2.5 metre
+            (2, 0.92, 600, 350, 1000, 550, 8.0),   # Uzak araba, 8 metre
+            (1, 0.78, 50, 400, 150, 500, 5.0),     # Sol tarafta bisiklet, 5 metre
+        ], dtype=DEMO_DETECTION_DTYPE)
+        self.demo_class_names = ['person', 'car', 'bicycle']
+    
+    def _to_dict_list(self) -> List[Dict]:
+        """
+        Demo algılamalarını sözlük listesine çevir
+        
+        distance_checker, nav_guide ve tracker hâlâ sözlük beklediği için
+        geçiş katmanı olarak kullanılır; her çağrıda yeni sözlükler üretir.
+        """
+        self._ensure_demo_detections()
+        
+        detections = []
+        for class_name, det in zip(self.demo_class_names, self.demo_detections_np.tolist()):
+            class_id, confidence, x1, y1, x2, y2, distance = det
+            detections.append({
+                'class_id': class_id,
+                'class_name': class_name,
+                'confidence': confidence,
+                'bbox': (x1, y1, x2, y2),
+                'center': ((x1 + x2) // 2, (y1 + y2) // 2),
+                'width': x2 - x1,
+                'height': y2 - y1,
+                'area': (x2 - x1) * (y2 - y1),
+                'distance_meters': distance
+            })
+        return detections
     
     def test_camera(self):
         """Kamera testi"""
@@ -98,14 +255,20 @@ class WindowsTestSystem:
                 print("⚠️ Kamera bulunamadı, demo modu kullanılacak")
                 return False
             
-            # Kamera ayarları - HD çözünürlük
+            # Kamera ayarları - HD çözünürlük, MJPG (USB bant genişliği için)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            self.cap.set(cv2.CAP_PROP_FPS, DEMO_TARGET_FPS)
+            
+            # Buffer size'ı azalt (gecikmeyi önlemek için)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
             # Test frame'i al
             ret, frame = self.cap.read()
             if ret:
                 print(f"✅ Kamera çalışıyor: {frame.shape}")
+                self._demo_mode = False
                 return True
             else:
                 print("❌ Frame alınamadı")
@@ -139,7 +302,16 @@ class WindowsTestSystem:
                 model = YOLO(model_path)
             
             print(f"✅ YOLO modeli yüklendi: {model_path}")
-            
+
+            # TensorRT yalnızca açıkça istenirse (USE_TENSORRT=true): ilk
+            # aktarım dakikalar sürer ve modelin yanına dosya yazar
+            if MODULES_AVAILABLE and not self.config.YOLO_EXPORT_FORMAT and cuda_available():
+                if USE_TENSORRT:
+                    self.config.YOLO_EXPORT_FORMAT = 'engine'
+                    print("🚀 CUDA bulundu, TensorRT motoru kullanılacak")
+                else:
+                    print("💡 CUDA bulundu; TensorRT için USE_TENSORRT=true ile çalıştırın")
+
             # Test görüntüsü ile test
             test_image = np.zeros((480, 640, 3), dtype=np.uint8)
             results = model(test_image, verbose=False)
@@ -159,12 +331,13 @@ class WindowsTestSystem:
             import pyttsx3
             engine = pyttsx3.init()
             
-            # Türkçe ses ayarları
+            # Türkçe ses ayarları (ilk eşleşmede dur)
             voices = engine.getProperty('voices')
-            for voice in voices:
-                if 'tr' in voice.id.lower() or 'turkish' in voice.name.lower():
-                    engine.setProperty('voice', voice.id)
-                    break
+            match = next((voice for voice in voices
+                          if TURKISH_VOICE_ID.search(voice.id)
+                          or TURKISH_VOICE_NAME.search(voice.name)), None)
+            if match:
+                engine.setProperty('voice', match.id)
             
             engine.setProperty('rate', 150)
             engine.setProperty('volume', 0.8)
@@ -180,63 +353,56 @@ class WindowsTestSystem:
             print(f"❌ TTS hatası: {e}")
             return False, None
     
-    def create_demo_frame(self, width=1280, height=720):
-        """Demo frame oluştur"""
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+    def _submit_alert(self, fn, *args, needs_sound: bool = True):
+        """
+        Sesli uyarı çağrısını tek işçili havuza gönder
         
-        # Arka plan gradyanı
-        for i in range(height):
-            intensity = int(50 + (i / height) * 100)
-            frame[i, :] = [intensity, intensity//2, intensity//3]
+        Havuzda ALERT_POOL_MAX_PENDING kadar bekleyen iş varsa çağrı
+        atlanır; böylece TTS yavaşladığında iş birikmez. Ses kapalıyken
+        (needs_sound=True) havuza hiç iş gönderilmez.
+        """
+        if needs_sound and not self.voice_alert.is_enabled:
+            return
+        if not self._alert_slots.acquire(blocking=False):
+            return
+        future = self._alert_pool.submit(fn, *args)
+        future.add_done_callback(lambda _: self._alert_slots.release())
+    
+    def _textsize(self, text, scale=0.8, thickness=2):
+        """
+        cv2.getTextSize sonucunu önbellekten döndür
         
-        # Demo nesneleri çiz
-        for detection in self.demo_detections:
-            x1, y1, x2, y2 = detection['bbox']
-            class_name = detection['class_name']
-            confidence = detection['confidence']
-            distance = detection.get('distance_meters', 0)
-            
-            # Color by object type
-            if class_name == 'person':
-                color = (0, 255, 0)  # Green
-            elif class_name == 'car':
-                color = (0, 0, 255)  # Red
-            elif class_name == 'bicycle':
-                color = (255, 0, 0)  # Blue
-            else:
-                color = (128, 128, 128)  # Gray
-            
-            # Uzaklığa göre çerçeve kalınlığı (yakın = kalın)
-            thickness = 4 if distance < 3 else 3 if distance < 6 else 2
-            
-            # Bounding box
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness)
-            
-            # Label - nesne adı, güven ve uzaklık
-            label = f"{class_name} {confidence:.2f} - {distance:.1f}m"
-            
-            # Label arka planı
-            (label_width, label_height), _ = cv2.getTextSize(
-                label, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2
-            )
-            cv2.rectangle(frame, (x1, y1-label_height-15), 
-                         (x1+label_width+10, y1), color, -1)
-            
-            # Label metni
-            cv2.putText(frame, label, (x1+5, y1-5), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-            
-            # Merkez noktası
-            center = detection['center']
-            cv2.circle(frame, center, 8, color, -1)
-            
-            # Draw distance circles (close = large circle)
-            if distance < 3:
-                cv2.circle(frame, center, 30, (0, 0, 255), 3)  # Red - dangerous
-            elif distance < 6:
-                cv2.circle(frame, center, 20, (0, 255, 255), 2)  # Yellow - caution
-            else:
-                cv2.circle(frame, center, 15, (0, 255, 0), 2)   # Green - safe
+        Etiketler kareler arasında büyük ölçüde tekrarlandığı için ölçüm
+        her metin/ölçek/kalınlık için bir kez yapılır.
+        
+        Returns:
+            Tuple[int, int]: (genişlik, yükseklik)
+        """
+        key = (text, scale, thickness)
+        size = self._textsize_cache.get(key)
+        if size is None:
+            if len(self._textsize_cache) >= TEXTSIZE_CACHE_LIMIT:
+                self._textsize_cache.clear()
+            size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
+            self._textsize_cache[key] = size
+        return size
+    
+    def _build_bg_template(self, width, height):
+        """
+        Statik demo arka planını oluştur
+        
+        Gradyan, bölge çizgileri ve bilgi panelleri her karede aynı
+        olduğu için boyut başına yalnızca bir kez çizilir.
+        
+        Returns:
+            Tuple: (arka plan karesi, statik katman maskesi)
+        """
+        # Arka plan gradyanı: satır renkleri (yükseklik, 3) bir kez hesaplanır,
+        # genişliğe broadcast ile tek geçişte yayılır
+        intensity = (50 + np.arange(height) / height * 100).astype(np.uint8)
+        row_colors = np.stack([intensity, intensity // 2, intensity // 3], axis=1)
+        gradient = np.broadcast_to(row_colors[:, None, :], (height, width, 3))
+        frame = gradient.copy()
         
         # Bölge çizgileri
         left_line = width // 3
@@ -262,7 +428,115 @@ class WindowsTestSystem:
         cv2.putText(frame, "Left: Bicycle (5.0m) | Center: Person (2.5m) | Right: Car (8.0m)", 
                    (20, height-20), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2)
         
-        return frame
+        # Statik çizim ve yazıların maskesi (nesnelerin üstüne yeniden basılır)
+        overlay_mask = (frame != gradient).any(axis=2)
+        
+        return frame, overlay_mask[..., None]
+    
+    def _get_bg_template(self, width, height):
+        """Boyuta göre önbellekteki statik arka planı ve katman maskesini döndür"""
+        key = (height, width)
+        template = self._bg_templates.get(key)
+        if template is None:
+            template = self._build_bg_template(width, height)
+            self._bg_templates[key] = template
+        return template
+    
+    def _acquire_frame(self, shape) -> np.ndarray:
+        """Havuzdan uygun boyutta kare tamponu al, yoksa yenisini ayır"""
+        try:
+            frame = self._frame_pool.get_nowait()
+            if frame.shape == shape:
+                return frame
+        except Empty:
+            pass
+        return np.empty(shape, dtype=np.uint8)
+    
+    def _release_frame(self, frame):
+        """Gösterilmiş kareyi havuza geri ver (UMat ve fazlası atılır)"""
+        if isinstance(frame, np.ndarray):
+            try:
+                self._frame_pool.put_nowait(frame)
+            except Full:
+                pass
+    
+    def _pooled_copy(self, frame: np.ndarray) -> np.ndarray:
+        """Kareyi havuzdan alınan tampona kopyala"""
+        out = self._acquire_frame(frame.shape)
+        np.copyto(out, frame)
+        return out
+    
+    def create_demo_frame(self, width=1280, height=720):
+        """
+        Demo frame oluştur
+        
+        Demo algılamaları değişmediyse önceki çizim yeniden kullanılır.
+        Çizim tek bir tamponda yapılır; kare thread'ler arasında
+        aktarıldığı ve üzerine çizildiği için çağırana her zaman kopya döner.
+        Kopya, gösterimi bitmiş karelerin havuzundan alınan tampona yapılır.
+        """
+        self._ensure_demo_detections()
+        
+        demo_key = (height, width, self.demo_detections_np.tobytes(),
+                    tuple(self.demo_class_names))
+        if demo_key == self._last_demo_key:
+            return self._pooled_copy(self._last_demo_frame)
+        
+        # Statik arka plan, önceden ayrılmış tampona kopyalanır; üzerine
+        # yalnızca nesneler çizilir
+        template, overlay_mask = self._get_bg_template(width, height)
+        frame = self._scratch_frame
+        if frame is None or frame.shape != template.shape:
+            frame = self._scratch_frame = np.empty_like(template)
+        np.copyto(frame, template)
+        
+        # Demo nesneleri çiz: renk, merkez ve kademeler sütunlar üzerinden
+        # tek seferde hesaplanır, döngüde yalnızca cv2 çağrıları kalır
+        dets = self.demo_detections_np
+        class_ids = np.minimum(dets['class_id'], len(CLASS_PALETTE) - 1)
+        colors = CLASS_PALETTE[class_ids].tolist()
+        centers_x = ((dets['x1'] + dets['x2']) // 2).tolist()
+        centers_y = ((dets['y1'] + dets['y2']) // 2).tolist()
+        tiers = distance_tiers(dets['distance'])
+        columns = zip(self.demo_class_names, dets['confidence'].tolist(),
+                      dets['x1'].tolist(), dets['y1'].tolist(),
+                      dets['x2'].tolist(), dets['y2'].tolist(),
+                      dets['distance'].tolist(), colors, centers_x, centers_y,
+                      TIER_BOX_THICKNESS[tiers].tolist(), TIER_RING_RADIUS[tiers].tolist(),
+                      TIER_RING_THICKNESS[tiers].tolist(), tiers.tolist())
+        
+        for (class_name, confidence, x1, y1, x2, y2, distance, color, cx, cy,
+             box_thickness, ring_radius, ring_thickness, tier) in columns:
+            color = tuple(color)
+            
+            # Bounding box (yakın = kalın)
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, box_thickness)
+            
+            # Label - nesne adı, güven ve uzaklık
+            label = f"{class_name} {confidence:.2f} - {distance:.1f}m"
+            
+            # Label arka planı
+            label_width, label_height = self._textsize(label, 0.8, 2)
+            cv2.rectangle(frame, (x1, y1-label_height-15), 
+                         (x1+label_width+10, y1), color, -1)
+            
+            # Label metni
+            cv2.putText(frame, label, (x1+5, y1-5), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+            
+            # Merkez noktası
+            center = (cx, cy)
+            cv2.circle(frame, center, 8, color, -1)
+            
+            # Draw distance circles (close = large circle)
+            cv2.circle(frame, center, ring_radius, TIER_RING_COLORS[tier], ring_thickness)
+        
+        # Bölge çizgileri ve bilgi yazıları nesnelerin üstünde kalsın
+        np.copyto(frame, template, where=overlay_mask)
+        
+        self._last_demo_key = demo_key
+        self._last_demo_frame = frame
+        return self._pooled_copy(frame)
     
     def run_demo(self, with_yolo=False, with_tts=False):
         """Demo modu çalıştır"""
@@ -289,275 +563,434 @@ class WindowsTestSystem:
                 with_tts = False
         
         # Test modules
+        self.yolo_model = yolo_model
+        self.detector = None
+        self.distance_checker = None
+        self.voice_alert = None
+        self.nav_guide = None
+        self.tracker = None
+        self.logger = None
+        self.last_alert_time = float('-inf')
+        self.track_alert_due = {}  # track_id -> sonraki uyarı zamanı (monotonic)
+        self._last_detect_t = float('-inf')
+        self._last_demo_t = float('-inf')
+        
         if MODULES_AVAILABLE:
             try:
-                detector = ObjectDetector(self.config) if with_yolo else None
-                distance_checker = DistanceChecker(self.config)
-                voice_alert = VoiceAlert(self.config) if with_tts else None
-                nav_guide = NavigationGuide(self.config)
-                tracker = ObjectTracker(self.config)  # Add object tracker
-                logger = DetectionLogger(self.config)  # Add CSV logger
+                self.detector = ObjectDetector(self.config) if with_yolo else None
+                self.distance_checker = DistanceChecker(self.config)
+                self.voice_alert = VoiceAlert(self.config) if with_tts else None
+                self.nav_guide = NavigationGuide(self.config)
+                self.tracker = ObjectTracker(self.config)  # Add object tracker
+                self.logger = DetectionLogger(self.config)  # Add CSV logger
                 print("✅ All modules loaded including object tracker and CSV logger")
             except Exception as e:
                 print(f"⚠️ Module loading error: {e}")
-                detector = None
-                distance_checker = None
-                voice_alert = None
-                nav_guide = None
-                tracker = None
-                logger = None
+                self.detector = None
+                self.distance_checker = None
+                self.voice_alert = None
+                self.nav_guide = None
+                self.tracker = None
+                self.logger = None
         
+        # OpenCL yalnızca ayar açıksa ve cihaz destekliyorsa kullanılır
+        self._use_opencl = (MODULES_AVAILABLE and self.config.USE_OPENCL
+                            and cv2.ocl.haveOpenCL())
+        cv2.ocl.setUseOpenCL(self._use_opencl)
+        if self._use_opencl:
+            print("🚀 OpenCL çizim hızlandırması etkin")
+        
+        # Pencereyi döngüden önce bir kez oluştur
+        cv2.namedWindow(DEMO_WINDOW_NAME, cv2.WINDOW_NORMAL)
+        cv2.resizeWindow(DEMO_WINDOW_NAME, 1280, 720)
+
+        # Demo modunda statik arka planı döngü başlamadan hazırla; ilk kare
+        # gradyan ve yazı çizimini beklemesin
+        if self._demo_mode:
+            self._get_bg_template(1280, 720)
+
+        # Yakalama -> analiz -> çizim -> gösterim hattı (tek elemanlı
+        # kuyruklar, yavaş aşama eski kareleri atar, kamera hiç beklemez)
         self.running = True
-        frame_count = 0
-        last_alert_time = 0
+        frame_queue = Queue(maxsize=1)
+        overlay_queue = Queue(maxsize=1)
+        display_queue = Queue(maxsize=1)
+        workers = [
+            threading.Thread(target=self._capture_loop, args=(frame_queue,), daemon=True),
+            threading.Thread(target=self._process_loop, args=(frame_queue, overlay_queue),
+                             daemon=True),
+            threading.Thread(target=self._compose_loop, args=(overlay_queue, display_queue),
+                             daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
         
         try:
+            # HighGUI çağrıları ana thread'de kalmalı
             while self.running:
-                # Frame al (kamera varsa gerçek, yoksa demo)
-                if self.cap and self.cap.isOpened():
-                    ret, frame = self.cap.read()
-                    if not ret:
-                        frame = self.create_demo_frame()
-                else:
-                    frame = self.create_demo_frame()
-                
-                frame_count += 1
-                current_time = time.time()
-                
-                # YOLO detection (if available)
-                raw_detections = []
-                if detector and yolo_model and frame_count % 10 == 0:  # Every 10 frames
-                    try:
-                        raw_detections = detector.detect_objects(frame)
-                    except Exception as e:
-                        print(f"Detection error: {e}")
-                
-                # Use demo data if no YOLO
-                if not raw_detections and frame_count % 30 == 0:
-                    raw_detections = self.demo_detections
-                
-                # Update object tracker with detections
-                tracked_detections = []
-                if tracker and raw_detections:
-                    try:
-                        tracked_detections = tracker.update(raw_detections)
-                        
-                        # Draw tracked objects with stability indicators
-                        for detection in tracked_detections:
-                            if detector:
-                                frame = detector.draw_detections(frame, [detection])
-                            
-                            # Add tracking info to display
-                            track_id = detection.get('track_id', 0)
-                            age = detection.get('age', 0)
-                            x, y = detection['center']
-                            
-                            # Show tracking ID and age
-                            cv2.putText(frame, f"ID:{track_id} Age:{age:.1f}s", 
-                                       (x-30, y-40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
-                            
-                            # Show stability indicator
-                            if detection.get('is_stable', False):
-                                cv2.circle(frame, (x, y), 5, (0, 255, 0), -1)  # Green dot for stable
-                            else:
-                                cv2.circle(frame, (x, y), 5, (0, 0, 255), -1)  # Red dot for unstable
+                try:
+                    frame = display_queue.get(timeout=0.1)
+                    cv2.imshow(DEMO_WINDOW_NAME, frame)
                     
-                    except Exception as e:
-                        print(f"Tracking error: {e}")
-                        tracked_detections = raw_detections
-                
-                # Use tracked detections for further processing
-                detections = tracked_detections if tracked_detections else raw_detections
-                
-                # Log all detections to CSV
-                if logger and detections:
-                    logger.log_detections_batch(detections, frame_count, frame.shape[1])
-                
-                # Distance and navigation analysis
-                if detections and MODULES_AVAILABLE:
-                    try:
-                        # Distance control
-                        if distance_checker:
-                            close_objects = distance_checker.check_distances(detections, frame.shape)
-                            
-                            # Continuous alerts for all stable tracked objects
-                            if tracker and voice_alert:
-                                # Get all stable objects, not just those ready for alerts
-                                for detection in detections:
-                                    if detection.get('is_stable', False):
-                                        # Force continuous alerts for stable objects
-                                        detection['should_alert'] = True
-                                        detection['should_distance_alert'] = True
-                                        
-                                        # Check if enough time has passed for this specific object
-                                        track_id = detection.get('track_id', 0)
-                                        distance = detection.get('distance_meters', 10)
-                                        
-                                        # Determine alert interval based on distance
-                                        if distance < 3:
-                                            alert_interval = 3.0  # Very close - every 3 seconds
-                                        elif distance < 6:
-                                            alert_interval = 6.0  # Close - every 6 seconds
-                                        else:
-                                            alert_interval = 10.0  # Far - every 10 seconds
-                                        
-                                        # Check last alert time for this specific object
-                                        alert_key = f"track_{track_id}"
-                                        last_time = getattr(self, 'last_track_alerts', {}).get(alert_key, 0)
-                                        
-                                        if (current_time - last_time) >= alert_interval:
-                                            # Update last alert time
-                                            if not hasattr(self, 'last_track_alerts'):
-                                                self.last_track_alerts = {}
-                                            self.last_track_alerts[alert_key] = current_time
-                                            
-                                            # Send alert
-                                            threading.Thread(
-                                                target=voice_alert.alert_close_object,
-                                                args=(detection,),
-                                                daemon=True
-                                            ).start()
-                                            
-                                            # Log alert to CSV
-                                            if logger:
-                                                logger.log_alert(
-                                                    detection, 
-                                                    'continuous_alert', 
-                                                    f"{detection['class_name']} at {distance:.1f}m",
-                                                    3 if distance < 3 else 2 if distance < 6 else 1
-                                                )
-                                            
-                                            print(f"🔊 Alert sent for {detection['class_name']} ID:{track_id} at {distance:.1f}m")
-                            
-                            # Fallback for non-tracked objects
-                            elif close_objects and voice_alert and (current_time - last_alert_time) > 5:
-                                threading.Thread(
-                                    target=voice_alert.alert_close_object,
-                                    args=(close_objects[0],),
-                                    daemon=True
-                                ).start()
-                                last_alert_time = current_time
-                            
-                            # Add detailed distance announcements for visually impaired users
-                            if voice_alert and detections:
-                                threading.Thread(
-                                    target=voice_alert.announce_distance_details,
-                                    args=(detections,),
-                                    daemon=True
-                                ).start()
-                        
-                        # Navigasyon analizi
-                        if nav_guide:
-                            nav_info = nav_guide.analyze_regions(detections, frame.shape)
-                            
-                            # Navigasyon bilgilerini ekranda göster
-                            direction = nav_info.get('recommended_direction', 'forward')
-                            cv2.putText(frame, f"Yon: {direction.upper()}", (10, 60),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                            
-                            # Yön uyarısı (10 saniye aralık)
-                            if (nav_info.get('center_blocked', False) and 
-                                voice_alert and 
-                                direction in ['left', 'right'] and 
-                                (current_time - last_alert_time) > 10):
-                                
-                                threading.Thread(
-                                    target=voice_alert.give_direction,
-                                    args=(direction,),
-                                    daemon=True
-                                ).start()
-                                last_alert_time = current_time
-                    
-                    except Exception as e:
-                        print(f"Analiz hatası: {e}")
-                
-                # Show FPS
-                fps = frame_count / max(current_time - time.time() + 1, 1)
-                cv2.putText(frame, f"FPS: {fps:.1f}", (1000, 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                
-                # Show object count and tracking stats
-                cv2.putText(frame, f"Objects: {len(detections)}", (1000, 60),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                
-                # Show tracking statistics
-                if tracker:
-                    stats = tracker.get_tracking_stats()
-                    cv2.putText(frame, f"Tracked: {stats['stable_tracks']}/{stats['total_tracks']}", 
-                               (1000, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                
-                # Show distance info for each object
-                for i, detection in enumerate(detections[:3]):  # Show first 3 objects
-                    distance = detection.get('distance_meters', 0)
-                    class_name = detection.get('class_name', 'unknown')
-                    track_id = detection.get('track_id', 'N/A')
-                    is_stable = detection.get('is_stable', False)
-                    
-                    # Show stability status
-                    stability_text = "STABLE" if is_stable else "UNSTABLE"
-                    color = (0, 255, 0) if is_stable else (0, 0, 255)
-                    
-                    info_text = f"{class_name} ID:{track_id} - {distance:.1f}m [{stability_text}]"
-                    cv2.putText(frame, info_text, (20, 100 + i*25),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
-                
-                # Show alert status and logging info
-                if hasattr(self, 'last_track_alerts') and self.last_track_alerts:
-                    alert_count = len(self.last_track_alerts)
-                    cv2.putText(frame, f"Active Alerts: {alert_count}", (20, 200),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-                
-                # Show logging status and language
-                if logger:
-                    stats = logger.get_session_stats()
-                    cv2.putText(frame, f"Logged: {stats['total_detections']} detections", (20, 230),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                    cv2.putText(frame, f"Session: {stats['duration_formatted']}", (20, 260),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-                
-                # Show current language
-                if voice_alert:
-                    current_lang = voice_alert.get_current_language().upper()
-                    cv2.putText(frame, f"Language: {current_lang}", (20, 290),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-                
-                # Frame'i tam ekran göster
-                cv2.namedWindow('Raspberry Pi Engelli Destek Sistemi - HD Test', cv2.WINDOW_NORMAL)
-                cv2.resizeWindow('Raspberry Pi Engelli Destek Sistemi - HD Test', 1280, 720)
-                cv2.imshow('Raspberry Pi Engelli Destek Sistemi - HD Test', frame)
+                    # imshow kendi kopyasını tutar; tampon yeniden kullanılabilir
+                    self._release_frame(frame)
+                except Empty:
+                    pass
                 
                 # Klavye kontrolü
                 key = cv2.waitKey(1) & 0xFF
                 if key == ord('q'):
                     break
-                elif key == ord('s') and voice_alert:
-                    voice_alert.toggle_sound()
-                elif key == ord('t') and voice_alert:
+                elif key == ord('s') and self.voice_alert:
+                    self.voice_alert.toggle_sound()
+                elif key == ord('t') and self.voice_alert:
                     # Test voice in current language
-                    threading.Thread(
-                        target=voice_alert.test_voice,
-                        daemon=True
-                    ).start()
-                elif key == ord('l') and voice_alert:
+                    self._submit_alert(self.voice_alert.test_voice, needs_sound=False)
+                elif key == ord('l') and self.voice_alert:
                     # Switch language
-                    threading.Thread(
-                        target=voice_alert.switch_language,
-                        daemon=True
-                    ).start()
-                
-                # CPU'yu rahatlatmak için kısa bekleme
-                time.sleep(0.033)  # ~30 FPS
+                    self._submit_alert(self.voice_alert.switch_language, needs_sound=False)
         
         except KeyboardInterrupt:
             print("\n🛑 Demo durduruldu")
         
         finally:
+            self.running = False
+            for worker in workers:
+                worker.join(timeout=1.0)
+            
             # Cleanup logger first to generate summary
-            if 'logger' in locals() and logger:
-                logger.cleanup()
+            if self.logger:
+                self.logger.cleanup()
             
             self.cleanup()
     
+    def _capture_loop(self, frame_queue: Queue):
+        """
+        Kare yakalama thread'i
+        
+        Kamera varsa gerçek kare, yoksa demo karesi üretir ve işleme
+        kuyruğuna en yeni kare olarak koyar.
+        """
+        frame_budget = 1.0 / DEMO_TARGET_FPS
+        
+        # Yeterli çekirdek varsa yakalamayı son çekirdeğe sabitle; YOLO ve
+        # OpenCV thread'leri kamerayı geciktirmesin
+        cpu_count = os.cpu_count() or 1
+        if cpu_count > RESERVED_CORES:
+            pin_current_thread(cpu_count - 1)
+        
+        while self.running:
+            loop_start = time.perf_counter()
+            
+            # Frame al (kamera varsa gerçek, yoksa demo)
+            paced = False
+            if self.cap and self.cap.isOpened():
+                ret, frame = self.cap.read()
+                paced = ret
+                if not ret:
+                    frame = self.create_demo_frame()
+            else:
+                frame = self.create_demo_frame()
+            
+            put_latest(frame_queue, frame)
+            
+            # Kamera kareleri geliş hızında akar (read() zaten bekler);
+            # yalnızca demo kareleri bütçeye göre beklenir (~30 FPS)
+            if not paced:
+                elapsed = time.perf_counter() - loop_start
+                if elapsed < frame_budget:
+                    time.sleep(frame_budget - elapsed)
+    
+    def _process_loop(self, frame_queue: Queue, overlay_queue: Queue):
+        """
+        Algılama, takip ve analiz thread'i
+        
+        Kuyruktan aldığı kareyi analiz eder ve kareyi çizilecek bilgilerle
+        birlikte çizim kuyruğuna koyar.
+        """
+        frame_count = 0
+        
+        while self.running:
+            try:
+                frame = frame_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            
+            frame_count += 1
+            try:
+                overlay = self._analyze_frame(frame, frame_count)
+            except Exception as e:
+                print(f"İşleme hatası: {e}")
+                overlay = None
+            
+            put_latest(overlay_queue, (frame, overlay))
+    
+    def _compose_loop(self, overlay_queue: Queue, display_queue: Queue):
+        """
+        Çizim (compositor) thread'i
+        
+        Analiz sonuçlarını kareye çizer ve gösterim kuyruğuna koyar;
+        ana thread yalnızca imshow/waitKey yapar. FPS, çizilen kareler
+        üzerinden hesaplanır.
+        """
+        frame_times = deque(maxlen=FPS_WINDOW_FRAMES)
+        
+        while self.running:
+            try:
+                frame, overlay = overlay_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            
+            # Kayan pencere FPS: son karelerin zaman aralığından
+            frame_times.append(time.perf_counter())
+            fps = 0.0
+            if len(frame_times) > 1:
+                fps = (len(frame_times) - 1) / max(frame_times[-1] - frame_times[0], 1e-6)
+            
+            if overlay is not None:
+                try:
+                    frame = self._compose_frame(frame, overlay, fps)
+                except Exception as e:
+                    print(f"Çizim hatası: {e}")
+            
+            put_latest(display_queue, frame)
+    
+    def _analyze_frame(self, frame: np.ndarray, frame_count: int) -> Dict:
+        """
+        Tek kareyi analiz et: algılama, takip, loglama ve uyarılar
+        
+        Kareye çizim yapmaz; çizilecek bilgileri döndürür.
+        
+        Args:
+            frame: İşlenecek kare
+            frame_count: İşlenen kare sayacı
+            
+        Returns:
+            Dict: _compose_frame için ekran bilgileri
+        """
+        now = time.monotonic()
+        
+        # YOLO detection (if available), kare sayısından bağımsız sabit aralıkla
+        raw_detections = []
+        if self.detector and self.yolo_model and (now - self._last_detect_t) >= INFER_PERIOD:
+            self._last_detect_t = now
+            try:
+                raw_detections = self.detector.detect_objects(frame)
+            except Exception as e:
+                print(f"Detection error: {e}")
+        
+        # Use demo data if no YOLO (canlı kamerada sahte kutu gösterme)
+        if (self._demo_mode and not raw_detections and
+                (now - self._last_demo_t) >= DEMO_REFRESH_PERIOD):
+            self._last_demo_t = now
+            raw_detections = self._to_dict_list()
+        
+        frame_shape = frame.shape
+        direction = None
+        
+        # Update object tracker with detections
+        tracked_detections = []
+        if self.tracker and raw_detections:
+            try:
+                tracked_detections = self.tracker.update(raw_detections)
+            
+            except Exception as e:
+                print(f"Tracking error: {e}")
+                tracked_detections = raw_detections
+        
+        # Use tracked detections for further processing
+        detections = tracked_detections if tracked_detections else raw_detections
+        
+        # Log all detections to CSV
+        if self.logger and detections:
+            self.logger.log_detections_batch(detections, frame_count, frame_shape[1])
+        
+        # Distance and navigation analysis
+        if detections and MODULES_AVAILABLE:
+            try:
+                # Distance control
+                if self.distance_checker:
+                    close_objects = self.distance_checker.check_distances(detections, frame_shape)
+                    
+                    # Continuous alerts for all stable tracked objects
+                    if self.tracker and self.voice_alert:
+                        # Uyarı aralığı kademeye göre (<3m 3s, 3-6m 6s, >6m 10s);
+                        # kademeler çizimle aynı tablodan, tek seferde hesaplanır
+                        tiers = distance_tiers(np.array([d.get('distance_meters', 10) for d in detections],
+                                                        dtype=np.float32))
+                        
+                        # Get all stable objects, not just those ready for alerts
+                        for detection, tier in zip(detections, tiers.tolist()):
+                            if detection.get('is_stable', False):
+                                # Force continuous alerts for stable objects
+                                detection['should_alert'] = True
+                                detection['should_distance_alert'] = True
+                                
+                                # Check if enough time has passed for this specific object
+                                track_id = detection.get('track_id', 0)
+                                distance = detection.get('distance_meters', 10)
+                                
+                                # Nesnenin bir sonraki uyarı zamanı geldi mi (tek karşılaştırma)
+                                if now >= self.track_alert_due.get(track_id, now):
+                                    self.track_alert_due[track_id] = now + TIER_ALERT_INTERVAL[tier]
+                                    
+                                    # Send alert
+                                    self._submit_alert(self.voice_alert.alert_close_object, detection)
+                                    
+                                    # Log alert to CSV
+                                    if self.logger:
+                                        self.logger.log_alert(
+                                            detection, 
+                                            'continuous_alert', 
+                                            f"{detection['class_name']} at {distance:.1f}m",
+                                            3 - tier
+                                        )
+                                    
+                                    print(f"🔊 Alert sent for {detection['class_name']} ID:{track_id} at {distance:.1f}m")
+                    
+                    # Fallback for non-tracked objects
+                    elif close_objects and self.voice_alert and (now - self.last_alert_time) > 5:
+                        self._submit_alert(self.voice_alert.alert_close_object, close_objects[0])
+                        self.last_alert_time = now
+                    
+                    # Add detailed distance announcements for visually impaired users
+                    if self.voice_alert and detections:
+                        self._submit_alert(self.voice_alert.announce_distance_details, detections)
+                
+                # Navigasyon analizi
+                if self.nav_guide:
+                    nav_info = self.nav_guide.analyze_regions(detections, frame_shape)
+                    
+                    # Navigasyon bilgisi ekranda gösterilecek
+                    direction = nav_info.get('recommended_direction', 'forward')
+                    
+                    # Yön uyarısı (10 saniye aralık)
+                    if (nav_info.get('center_blocked', False) and 
+                        self.voice_alert and 
+                        direction in ['left', 'right'] and 
+                        (now - self.last_alert_time) > 10):
+                        
+                        self._submit_alert(self.voice_alert.give_direction, direction)
+                        self.last_alert_time = now
+            
+            except Exception as e:
+                print(f"Analiz hatası: {e}")
+        
+        # Ekranda gösterilecek bilgiler (çizim thread'i tracker/logger'a dokunmaz)
+        return {
+            'tracked_detections': tracked_detections,
+            'frame_size': frame_shape[1::-1],
+            'detections': detections,
+            'direction': direction,
+            'tracking_stats': self.tracker.get_tracking_stats() if self.tracker else None,
+            'session_stats': self.logger.get_session_stats() if self.logger else None,
+            'alert_count': len(self.track_alert_due),
+            'language': (self.voice_alert.get_current_language().upper()
+                         if self.voice_alert else None),
+        }
+    
+    def _compose_frame(self, frame: np.ndarray, overlay: Dict, fps: float):
+        """
+        Analiz sonuçlarını kareye çiz
+        
+        Args:
+            frame: Analiz edilen kare
+            overlay: _analyze_frame çıktısı
+            fps: Ölçülen kare hızı
+            
+        Returns:
+            Bilgi eklenmiş kare (OpenCL açıksa cv2.UMat, imshow ikisini de kabul eder)
+        """
+        # Çizimler OpenCL açıksa GPU üzerindeki kopyaya yapılır
+        if self._use_opencl:
+            frame = cv2.UMat(frame)
+        
+        detections = overlay['detections']
+        frame_width, frame_height = overlay['frame_size']
+        
+        # Draw tracked objects with stability indicators
+        for detection in overlay['tracked_detections']:
+            if self.detector:
+                frame = self.detector.draw_detections(frame, [detection])
+            
+            # Küçük veya kare dışındaki nesnelere takip bilgisi çizme
+            x1, y1, x2, y2 = detection['bbox']
+            x, y = detection['center']
+            if (x2 - x1 < MIN_OVERLAY_SIZE or y2 - y1 < MIN_OVERLAY_SIZE
+                    or not (0 <= x < frame_width and 0 <= y < frame_height)):
+                continue
+            
+            # Add tracking info to display
+            track_id = detection.get('track_id', 0)
+            age = detection.get('age', 0)
+            
+            # Show tracking ID and age (kare kenarına kırpılmış)
+            cv2.putText(frame, f"ID:{track_id} Age:{age:.1f}s", 
+                       (max(0, x-30), max(12, y-40)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+            
+            # Show stability indicator
+            if detection.get('is_stable', False):
+                cv2.circle(frame, (x, y), 5, (0, 255, 0), -1)  # Green dot for stable
+            else:
+                cv2.circle(frame, (x, y), 5, (0, 0, 255), -1)  # Red dot for unstable
+        
+        # Navigasyon bilgilerini ekranda göster
+        direction = overlay['direction']
+        if direction:
+            cv2.putText(frame, f"Yon: {direction.upper()}", (10, 60),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        
+        # Show FPS
+        cv2.putText(frame, f"FPS: {fps:.1f}", (1000, 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        
+        # Show object count and tracking stats
+        cv2.putText(frame, f"Objects: {len(detections)}", (1000, 60),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        
+        # Show tracking statistics
+        stats = overlay['tracking_stats']
+        if stats:
+            cv2.putText(frame, f"Tracked: {stats['stable_tracks']}/{stats['total_tracks']}", 
+                       (1000, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+        
+        # Show distance info for each object
+        for i, detection in enumerate(detections[:3]):  # Show first 3 objects
+            distance = detection.get('distance_meters', 0)
+            class_name = detection.get('class_name', 'unknown')
+            track_id = detection.get('track_id', 'N/A')
+            is_stable = detection.get('is_stable', False)
+            
+            # Show stability status
+            stability_text = "STABLE" if is_stable else "UNSTABLE"
+            color = (0, 255, 0) if is_stable else (0, 0, 255)
+            
+            info_text = f"{class_name} ID:{track_id} - {distance:.1f}m [{stability_text}]"
+            cv2.putText(frame, info_text, (20, 100 + i*25),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        
+        # Show alert status and logging info
+        alert_count = overlay['alert_count']
+        if alert_count:
+            cv2.putText(frame, f"Active Alerts: {alert_count}", (20, 200),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+        
+        # Show logging status and language
+        stats = overlay['session_stats']
+        if stats:
+            cv2.putText(frame, f"Logged: {stats['total_detections']} detections", (20, 230),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+            cv2.putText(frame, f"Session: {stats['duration_formatted']}", (20, 260),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        
+        # Show current language
+        current_lang = overlay['language']
+        if current_lang:
+            cv2.putText(frame, f"Language: {current_lang}", (20, 290),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+        
+        return frame
+    
     def cleanup(self):
         """Kaynakları temizle"""
         self.running = False
@@ -565,12 +998,18 @@ class WindowsTestSystem:
         if self.cap:
             self.cap.release()
         
+        self._alert_pool.shutdown(wait=False)
+        
         cv2.destroyAllWindows()
         print("✅ Kaynaklar temizlendi")
 
 
 def main():
     """Ana fonksiyon"""
+    # Uyarı debug satırları kuyruktan ayrı thread'de yazılır
+    if MODULES_AVAILABLE:
+        start_queued_logging()
+    
     print("🖥️ Windows Test Sistemi")
     print("=" * 40)
     